@@ -6,7 +6,7 @@ a = Analysis(
     pathex=[],
     binaries=[],
     datas=[('style.qss', '.')],
-    hiddenimports=[],
+    hiddenimports=['pyarrow', 'pyarrow.csv', 'pyarrow.parquet', 'orjson'],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
@@ -1,22 +1,40 @@
+import copy
+import functools
 import json
 import os
 import re
 import shutil
 import sys
+import tempfile
 import time
 
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List
 
 # Third-party imports
+import numpy as np
 import pandas as pd
 
+try:
+    import orjson  # Optional: C-backed JSON, much faster on the many small metadata files
+except ImportError:
+    orjson = None
+
+try:
+    import pyarrow  # Optional: Parquet sidecar cache and faster CSV writes for session files
+    import pyarrow.csv
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
 # PyQt6 imports
-from PyQt6.QtCore import QDate, QObject, QEvent, Qt, QSize, pyqtSignal, QSettings, QCoreApplication
+from PyQt6.QtCore import QDate, QObject, QEvent, Qt, QSize, pyqtSignal, QSettings, QCoreApplication, QRunnable, QThreadPool, QFileSystemWatcher, QTimer, QAbstractTableModel, QModelIndex
 from PyQt6.QtGui import QAction, QIcon, QDoubleValidator, QColor, QFont
 from PyQt6.QtWidgets import (
+    QAbstractItemView,
     QApplication,
     QButtonGroup,
     QComboBox,
@@ -25,7 +43,6 @@ from PyQt6.QtWidgets import (
     QDialogButtonBox,
     QFileDialog,
     QFormLayout,
-    QFrame,
     QGridLayout,
     QGroupBox,
     QHeaderView,
@@ -36,14 +53,13 @@ from PyQt6.QtWidgets import (
     QMessageBox,
     QPushButton,  
     QRadioButton,  
-    QScrollArea,
     QSizePolicy,
     QSpacerItem,
     QSplitter,
     QStackedWidget,
+    QStyledItemDelegate,
     QTabWidget,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QTextEdit,
     QToolButton,
     QTreeWidget,
@@ -65,6 +81,297 @@ class WheelEventFilter(QObject):
             return True  # Block the wheel event
         return super().eventFilter(obj, event)
 
+class CsvTaskSignals(QObject):
+    finished = pyqtSignal(object)  # The CsvReadTask/CsvWriteTask that finished
+
+class CsvWriteTask(QRunnable):
+    """Writes one DataFrame to CSV on a QThreadPool worker."""
+    def __init__(self, df: pd.DataFrame, path):
+        super().__init__()
+        self.setAutoDelete(False)  # We read .error after the pool is done with it
+        self.df = df
+        self.path = path
+        self.error = None
+        self.signals = CsvTaskSignals()
+
+    def run(self):
+        try:
+            write_session_csv(self.df, self.path, sidecar=True)
+        except Exception as e:
+            self.error = e
+        self.signals.finished.emit(self)
+
+class CsvReadTask(QRunnable):
+    """Reads (and optionally prepares) one session CSV on a QThreadPool worker."""
+    def __init__(self, path, prepare=None):
+        super().__init__()
+        self.setAutoDelete(False)  # We read .df/.error after the pool is done with it
+        self.path = path
+        self.prepare = prepare
+        self.df = None
+        self.error = None
+        self.signals = CsvTaskSignals()
+
+    def run(self):
+        try:
+            # The pandas C parser releases the GIL, so several of these overlap
+            df = read_session_csv(self.path)
+            self.df = self.prepare(df) if self.prepare else df
+        except Exception as e:
+            self.error = e
+        self.signals.finished.emit(self)
+
+class ArrayTableModel(QAbstractTableModel):
+    """Read-only table model over a 2-D NumPy array with column and row labels."""
+    def __init__(self, values: np.ndarray, columns: List[str], rows: List[str], parent=None):
+        super().__init__(parent)
+        self._values = values
+        self._columns = list(columns)
+        self._rows = list(rows)
+        self._display = self._format_all(values)
+
+    def set_values(self, values: np.ndarray, columns: List[str], rows: List[str]):
+        self.beginResetModel()
+        self._values = values
+        self._columns = list(columns)
+        self._rows = list(rows)
+        self._display = self._format_all(values)
+        self.endResetModel()
+
+    def _format_all(self, values: np.ndarray) -> List[List[str]]:
+        # Formatted once per update; data() is hit on every repaint and scroll
+        return [[self.format_value(v) for v in row] for row in values.tolist()]
+
+    def format_value(self, value) -> str:
+        return str(value)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._columns)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._display[index.row()][index.column()]
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            return Qt.AlignmentFlag.AlignCenter
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return self._columns[section]
+        return self._rows[section]
+
+    def flags(self, index):
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+
+class StatusCountsModel(ArrayTableModel):
+    def format_value(self, value) -> str:
+        return str(int(value))
+
+class FinancialModel(ArrayTableModel):
+    def format_value(self, value) -> str:
+        return f"${value:.2f}"
+
+class PersonStatusModel(QAbstractTableModel):
+    """One row per registrant across the given CSVs; the Status column edits current_status in place."""
+    COLUMNS = ["File", "Name", "Default", "Status"]
+    STATUS_COLUMN = 3
+    statusChanged = pyqtSignal(str, object, str, str)  # path, row index, previous status, new status
+
+    def __init__(self, dataframes: Dict[str, pd.DataFrame], parent=None):
+        super().__init__(parent)
+        self._dataframes = dataframes
+        self._rows = []
+
+    def set_rows(self, dataframes: Dict[str, pd.DataFrame], paths: List[str]):
+        self.beginResetModel()
+        self._dataframes = dataframes
+        self._rows = [(path, idx) for path in paths for idx in dataframes[path].index]
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.COLUMNS)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        path, idx = self._rows[index.row()]
+        col = index.column()
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            if col == 0:
+                return os.path.basename(path)
+            df = self._dataframes[path]
+            if col == 1:
+                return str(df.at[idx, "Name"])
+            if col == 2:
+                return str(df.at[idx, "default_status"])
+            return str(df.at[idx, "current_status"])
+        return None
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        if not index.isValid() or index.column() != self.STATUS_COLUMN or role != Qt.ItemDataRole.EditRole:
+            return False
+        path, idx = self._rows[index.row()]
+        df = self._dataframes[path]
+        previous = df.at[idx, "current_status"]
+        if previous == value:
+            return False
+        df.at[idx, "current_status"] = value
+        self.dataChanged.emit(index, index, [role])
+        self.statusChanged.emit(path, idx, str(previous), value)
+        return True
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.COLUMNS[section]
+        return None
+
+    def flags(self, index):
+        flags = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+        if index.column() == self.STATUS_COLUMN:
+            flags |= Qt.ItemFlag.ItemIsEditable
+        return flags
+
+class StatusButtonsDelegate(QStyledItemDelegate):
+    """Editor for the Status column: one exclusive checkable button per status."""
+    def createEditor(self, parent, option, index):
+        editor = QWidget(parent)
+        row = QHBoxLayout(editor)
+        row.setContentsMargins(4, 2, 4, 2)
+        editor.button_group = QButtonGroup(editor)
+        editor.button_group.setExclusive(True)
+        editor.selected_status = None
+        for status in STATUS_LIST:
+            btn = QPushButton(status.replace("_", " ").capitalize())
+            btn.setFixedWidth(110)
+            btn.setFixedHeight(32)
+            btn.setCheckable(True)
+            btn.setProperty("status", status)
+            editor.button_group.addButton(btn)
+            row.addWidget(btn)
+
+        def on_clicked(btn, editor=editor):
+            editor.selected_status = btn.property("status")
+            self.commitData.emit(editor)
+
+        editor.button_group.buttonClicked.connect(on_clicked)
+        return editor
+
+    def setEditorData(self, editor, index):
+        current = index.data(Qt.ItemDataRole.EditRole)
+        editor.selected_status = current
+        for btn in editor.button_group.buttons():
+            btn.setChecked(btn.property("status") == current)
+
+    def setModelData(self, editor, model, index):
+        if editor.selected_status:
+            model.setData(index, editor.selected_status, Qt.ItemDataRole.EditRole)
+
+    def updateEditorGeometry(self, editor, option, index):
+        editor.setGeometry(option.rect)
+
+class DataFrameModel(QAbstractTableModel):
+    """Read-only view of a DataFrame; cells are turned into text only when Qt asks for them."""
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._arr = np.empty((0, 0), dtype=object)
+        self._columns = []
+        self._row_colors = None
+
+    def set_frame(self, df: pd.DataFrame, colors: Dict[str, QColor] = None, color_column: str = None):
+        """Shows df; when colors is given, rows are shaded by their value in color_column."""
+        self.beginResetModel()
+        self._arr = df.to_numpy(dtype=object)
+        self._columns = [str(c) for c in df.columns]
+        # One colour per row, resolved up front: a lookup per distinct value (file), not per painted cell
+        if colors and color_column in df.columns:
+            codes, uniques = pd.factorize(df[color_column])
+            palette = np.empty(len(uniques) + 1, dtype=object)
+            palette[:-1] = [colors.get(u, QColor("white")) for u in uniques]
+            palette[-1] = QColor("white")  # factorize codes missing values as -1
+            self._row_colors = palette[codes]
+        else:
+            self._row_colors = None
+        self.endResetModel()
+
+    def show_message(self, header: str, text: str):
+        self.set_frame(pd.DataFrame({header: [text]}))
+
+    def clear(self):
+        self.set_frame(pd.DataFrame())
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._arr.shape[0]
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._columns)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            return str(self._arr[index.row(), index.column()])
+        if role == Qt.ItemDataRole.BackgroundRole and self._row_colors is not None:
+            return self._row_colors[index.row()]
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return self._columns[section]
+        return str(section + 1)
+
+    def flags(self, index):
+        return READ_ONLY_ITEM_FLAGS
+
+def make_dataframe_table() -> QTableView:
+    """A QTableView with its own DataFrameModel, sized from a sample of rows."""
+    view = QTableView()
+    model = DataFrameModel(view)
+    view.setModel(model)
+    view.horizontalHeader().setResizeContentsPrecision(50)  # Size columns from the first 50 rows, not every cell
+    view.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+    view.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+    return view
+
+def compute_financials(prices, regular, manual) -> np.ndarray:
+    """Returns an (N, 4) array of gross, TrackitHub cut, PayPal fees and net, one row per file.
+
+    PayPal charges every regular registration 5% + $0.09 at $10 and under, 3.49% + $0.49 above.
+    """
+    prices = np.asarray(prices, dtype=np.float64)
+    regular = np.asarray(regular, dtype=np.float64)
+    manual = np.asarray(manual, dtype=np.float64)
+
+    gross = (regular + manual) * prices
+    trackithub = gross * 0.10
+    paypal_per_txn = np.where(prices <= 10, prices * 0.05 + 0.09, prices * 0.0349 + 0.49)
+    paypal = paypal_per_txn * regular
+    net = gross - trackithub - paypal
+    return np.column_stack([gross, trackithub, paypal, net])
+
+def make_summary_table(model: ArrayTableModel) -> QTableView:
+    """Wraps a summary model in a read-only, column-stretched QTableView that owns it."""
+    view = QTableView()
+    view.setModel(model)
+    model.setParent(view)
+    view.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+    view.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+    view.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+    # Fixed row heights, so the view never asks the model for per-cell size hints
+    view.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+    return view
+
 settings = QSettings("TrackitHub", "AnkleBreaker")
 
 base_path = settings.value("base_path", str(Path.home() / "AnkleBreakerData"))
@@ -90,47 +397,322 @@ COMPED_NAMES = {
     "anderson leclair",
     "the ghost"
 }
+SESSION_REFRESH_DEBOUNCE_MS = 200
 STATUS_LIST = ["regular", "manual", "comped", "refund", "waitlist", "other"]
+# Checked in order, first match wins
+NOTES_STATUS_RULES = [
+    ("comped", "comped"),
+    ("no capacity, and room on the waiting list : register", "waitlist"),
+    ("refund", "refund"),
+    ("manually confirmed by", "manual"),
+    ("not over capacity: register", "regular"),
+]
+# All rules as one alternation; group i + 1 is NOTES_STATUS_RULES[i]
+NOTES_STATUS_RE = re.compile("|".join(f"({re.escape(needle)})" for needle, _ in NOTES_STATUS_RULES))
+READ_ONLY_ITEM_FLAGS = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+FLAG_SUFFIX_RE = re.compile(r"-flag(?=\.csv$)")
+CSV_WRITE_CHUNKSIZE = 10_000  # Rows per to_csv chunk, keeps peak memory bounded on big exports
+# Every session column is text: reading it as such skips dtype inference and the per-cell NaN scan,
+# and keeps phone numbers from round-tripping as floats. Empty cells come back as "".
+# memory_map lets the C parser tokenize straight from the page cache instead of copying through fread.
+SESSION_CSV_BASE_COLUMNS = ["Name", "Email", "Phone Number", "Status", "Registration Time", "Notes"]
+SESSION_CSV_READ_OPTIONS = {"dtype": str, "na_filter": False, "engine": "c", "memory_map": True}
+
+def write_json_atomic(path, obj):
+    """Writes obj as JSON to a temp file beside path, then swaps it in, so readers never see a half-written file."""
+    tmp = f"{path}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(json_dumps(obj))
+    os.replace(tmp, path)
 
 def write_metadata(meta_path: str, metadata: dict):
     """Writes a metadata dictionary to disk."""
     try:
         os.makedirs(os.path.dirname(meta_path), exist_ok=True)
-        with open(meta_path, "w") as f:
-            json.dump(metadata, f, indent=4)
+        write_json_atomic(meta_path, metadata)
+        remember_metadata(meta_path, copy.deepcopy(metadata))
     except Exception as e:
         print(f"[ERROR] Failed to write metadata to {meta_path}: {e}")
 
+def json_loads(raw: bytes):
+    """Parses JSON bytes with orjson when available, stdlib json otherwise."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+def _json_default(obj):
+    # Mirrors OPT_SERIALIZE_NUMPY for the stdlib fallback (counts and totals are often NumPy scalars)
+    if isinstance(obj, (np.generic, np.ndarray)):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def json_dumps(obj) -> bytes:
+    """Serializes metadata to indented JSON bytes with orjson when available, stdlib json otherwise.
+
+    Both paths produce the same layout: 2-space indent, UTF-8, NumPy values as plain numbers.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(obj, indent=2, ensure_ascii=False, default=_json_default).encode("utf-8")
+
+# meta_path -> ((mtime_ns, size), metadata, display_parts); see read_metadata
+_METADATA_CACHE: Dict[str, tuple] = {}
+
+def read_metadata(meta_path) -> dict:
+    """Reads a metadata.json, served from memory while the file is unchanged on disk.
+
+    The returned dict is shared with the cache, so treat it as read-only.
+    """
+    key = str(meta_path)
+    st = os.stat(key)
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _METADATA_CACHE.get(key)
+    if cached and cached[0] == stamp:
+        return cached[1]
+    with open(key, "rb") as f:
+        data = json_loads(f.read())
+    _METADATA_CACHE[key] = (stamp, data, format_session_display_parts(data))
+    return data
+
+def remember_metadata(meta_path, metadata: dict):
+    """Seeds the read_metadata cache with a dict just written to meta_path, so the next read skips the parse."""
+    key = str(meta_path)
+    st = os.stat(key)
+    _METADATA_CACHE[key] = ((st.st_mtime_ns, st.st_size), metadata, format_session_display_parts(metadata))
+
+def format_session_display_parts(metadata: dict) -> tuple:
+    """Returns the (paid status, net total) labels shown next to a session in the trees."""
+    status_str = "paid ✅" if metadata.get("paid", False) else "unpaid ❌"
+    net = metadata.get("net_to_club", None)
+    formatted_total = f"${net:.2f}" if isinstance(net, (int, float)) else "No total yet"
+    return status_str, formatted_total
+
+def session_display_parts(meta_path) -> tuple:
+    """Cached format_session_display_parts for a metadata.json; recomputed only when the file changes."""
+    read_metadata(meta_path)
+    return _METADATA_CACHE[str(meta_path)][2]
+
+# Parquet schema metadata key holding the (st_mtime_ns, st_size) of the CSV a sidecar was saved from
+SIDECAR_STAMP_KEY = b"anklebreaker.csv_stamp"
+
+def csv_stamp(path) -> bytes:
+    st = os.stat(path)
+    return f"{st.st_mtime_ns}:{st.st_size}".encode()
+
+def read_session_csv(path, columns: List[str] = None) -> pd.DataFrame:
+    """pd.read_csv for session files, reusing the Parquet sidecar (<file>.csv.parquet) when it was saved from this exact CSV.
+
+    The sidecar holds the CSV's text, so both paths return the same str columns. With columns,
+    only those of them present in the file are returned (and read, from a sidecar). Reading
+    never writes a sidecar; see write_session_csv.
+    """
+    if pyarrow is not None:
+        sidecar = f"{path}.parquet"
+        try:
+            schema = pyarrow.parquet.read_schema(sidecar)
+            fresh = (schema.metadata or {}).get(SIDECAR_STAMP_KEY) == csv_stamp(path)
+        except (OSError, pyarrow.ArrowException):
+            fresh = False  # No sidecar, or an unreadable one
+        if fresh:
+            if columns is not None:
+                columns = [c for c in columns if c in schema.names]
+            return pd.read_parquet(sidecar, engine="pyarrow", columns=columns)
+
+    return pd.read_csv(path, usecols=(lambda c: c in columns) if columns is not None else None, **SESSION_CSV_READ_OPTIONS)
+
+def write_parquet_sidecar(df: pd.DataFrame, path) -> None:
+    """Saves df as path's Parquet sidecar, stamped with the CSV just written to path.
+
+    Stored as the strings the CSV holds, so read_session_csv returns the same frame either way.
+    """
+    text = df.astype(str).mask(df.isna(), "")
+    table = pyarrow.Table.from_pandas(text, preserve_index=False)
+    table = table.replace_schema_metadata({**(table.schema.metadata or {}), SIDECAR_STAMP_KEY: csv_stamp(path)})
+    pyarrow.parquet.write_table(table, f"{path}.parquet")
+
+@functools.lru_cache(maxsize=None)
+def pyarrow_csv_writer_ok() -> bool:
+    """Whether pyarrow's CSV writer is usable here: checked once, by writing a sample session
+    frame both ways and reading each back through SESSION_CSV_READ_OPTIONS.
+
+    An older pyarrow (no quoting_style) or any difference from df.to_csv keeps saves on pandas.
+    """
+    if pyarrow is None:
+        return False
+    sample = pd.DataFrame({
+        "Name": ["Lee, Ann", 'Bo "B" Ray', ""],
+        "Phone Number": ["0123", "", "555-0100"],
+        "Notes": ["line one\nline two", "comped", ""],
+        "current_status": pd.Categorical(["regular", None, "other"], categories=STATUS_LIST),
+    })
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            arrow_path = os.path.join(tmp, "arrow.csv")
+            pandas_path = os.path.join(tmp, "pandas.csv")
+            table = pyarrow.Table.from_pandas(sample, preserve_index=False)
+            pyarrow.csv.write_csv(table, arrow_path, pyarrow.csv.WriteOptions(quoting_style="needed"))
+            sample.to_csv(pandas_path, index=False)
+            arrow_df = pd.read_csv(arrow_path, **SESSION_CSV_READ_OPTIONS)
+            pandas_df = pd.read_csv(pandas_path, **SESSION_CSV_READ_OPTIONS)
+            if arrow_df.equals(pandas_df):
+                return True
+            print("[WARNING] pyarrow CSV output differs from pandas; writing session CSVs with pandas")
+    except (TypeError, pyarrow.ArrowException) as e:
+        print(f"[WARNING] pyarrow {pyarrow.__version__} CSV writer unusable ({e}); writing session CSVs with pandas")
+    return False
+
+def write_session_csv(df: pd.DataFrame, path, sidecar: bool = False) -> None:
+    """df.to_csv(path, index=False), through pyarrow's C++ CSV writer when it is installed.
+
+    With sidecar (bulk saves on the pool), the file's Parquet sidecar is saved too, so the next
+    read_session_csv of it skips parsing the CSV we just wrote. Single-row saves on the UI
+    thread just drop the old sidecar.
+    """
+    written = False
+    # pandas raises the "non-existent directory" error the -flag rename fallbacks look for
+    if pyarrow_csv_writer_ok() and os.path.isdir(os.path.dirname(path) or "."):
+        try:
+            table = pyarrow.Table.from_pandas(df, preserve_index=False)
+            pyarrow.csv.write_csv(table, path, pyarrow.csv.WriteOptions(quoting_style="needed"))
+            written = True
+        except (TypeError, pyarrow.ArrowException):
+            pass  # Mixed-type or unsupported columns; pandas can still write them
+    if not written:
+        df.to_csv(path, index=False, chunksize=CSV_WRITE_CHUNKSIZE)
+
+    if pyarrow is None:
+        return
+    try:
+        if sidecar:
+            write_parquet_sidecar(df, path)
+        else:
+            os.remove(f"{path}.parquet")
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        # The stamp check in read_session_csv still keeps a stale sidecar from being used
+        print(f"[WARNING] Could not update Parquet cache for {path}: {e}")
+
+def remove_session_csv(path) -> None:
+    """os.remove for a session CSV, along with its Parquet sidecar if it has one."""
+    os.remove(path)
+    try:
+        os.remove(f"{path}.parquet")
+    except OSError:
+        pass
+
+def rename_session_csv(src, dst) -> None:
+    """os.rename for a session CSV; its Parquet sidecar follows it, or is dropped if it can't."""
+    os.rename(src, dst)
+    sidecar = f"{src}.parquet"
+    if not os.path.exists(sidecar):
+        return
+    try:
+        os.replace(sidecar, f"{dst}.parquet")
+    except OSError:
+        try:
+            os.remove(sidecar)
+        except OSError as e:
+            print(f"[WARNING] Could not remove Parquet cache {sidecar}: {e}")
+
+# path -> ((mtime_ns, size), DataFrame), least recently used first; see read_csv_cached
+_CSV_CACHE: "OrderedDict[str, tuple]" = OrderedDict()
+CSV_CACHE_SIZE = 32
+
+def read_csv_cached(path, columns: List[str] = None) -> pd.DataFrame:
+    """read_session_csv behind a small in-memory LRU, for the viewers that reopen the same few files.
+
+    Returns a copy, so callers are free to add or edit columns. Projected (columns=) reads
+    are served from a cached full frame when there is one, but are not cached themselves.
+    """
+    key = str(path)
+    st = os.stat(key)
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _CSV_CACHE.get(key)
+    if cached and cached[0] == stamp:
+        _CSV_CACHE.move_to_end(key)
+        df = cached[1]
+        if columns is not None:
+            df = df[[c for c in columns if c in df.columns]]
+        return df.copy()
+    if columns is not None:
+        return read_session_csv(key, columns)
+    df = read_session_csv(key)
+    _CSV_CACHE[key] = (stamp, df)
+    _CSV_CACHE.move_to_end(key)
+    while len(_CSV_CACHE) > CSV_CACHE_SIZE:
+        _CSV_CACHE.popitem(last=False)
+    return df.copy()
+
+def run_csv_reads(paths, prepare=None) -> List[CsvReadTask]:
+    """Reads session CSVs in parallel and waits for them; returns the finished tasks (in order) with their .df/.error.
+
+    Runs on a pool of its own, so the wait never includes unrelated global-pool work.
+    Only for callers that can't go on without the frames; otherwise use start_csv_reads.
+    """
+    pool = QThreadPool()
+    tasks = [CsvReadTask(path, prepare) for path in paths]
+    for task in tasks:
+        pool.start(task)
+    pool.waitForDone()
+    return tasks
+
+def start_csv_tasks(tasks, on_done) -> None:
+    """Starts CsvReadTasks/CsvWriteTasks on the global QThreadPool without blocking the UI;
+    on_done(tasks) is called on the UI thread once every one of them has finished."""
+    if not tasks:
+        on_done(tasks)
+        return
+    remaining = [len(tasks)]
+
+    def on_finished(_task):
+        remaining[0] -= 1
+        if remaining[0] == 0:
+            on_done(tasks)
+
+    pool = QThreadPool.globalInstance()
+    for task in tasks:
+        task.signals.finished.connect(on_finished)
+        pool.start(task)
+
+def start_csv_reads(paths, on_done, prepare=None) -> None:
+    """Non-blocking run_csv_reads: on_done(tasks) gets the finished tasks, in path order, with their .df/.error."""
+    start_csv_tasks([CsvReadTask(path, prepare) for path in paths], on_done)
+
+def start_csv_writes(jobs, on_done) -> None:
+    """Writes (df, path) pairs in parallel; on_done(tasks) gets the finished tasks with their .error."""
+    start_csv_tasks([CsvWriteTask(df, path) for df, path in jobs], on_done)
+
 def determine_default_status(notes: str, name: str) -> str:
     """Returns default status for a participant based on notes and name."""
     name_lower = str(name).strip().lower()
     if name_lower in COMPED_NAMES:
         return "comped"
 
-    notes_lower = str(notes).lower()
-    if "comped" in notes_lower:
-        return "comped"
-    elif "no capacity, and room on the waiting list : register" in notes_lower:
-        return "waitlist"
-    elif "refund" in notes_lower:
-        return "refund"
-    elif "manually confirmed by" in notes_lower:
-        return "manual"
-    elif "not over capacity: register" in notes_lower:
-        return "regular"
-    else:
-        return "other"
+    # One pass over the notes; the earliest rule among the matches wins, not the earliest position
+    matched = {m.lastindex for m in NOTES_STATUS_RE.finditer(str(notes).lower())}
+    return NOTES_STATUS_RULES[min(matched) - 1][1] if matched else "other"
+
+def determine_default_statuses(df: pd.DataFrame) -> pd.Series:
+    """Vectorized determine_default_status over a whole DataFrame's Notes/Name columns."""
+    notes_lower = df["Notes"].astype(str).str.lower()
+    names_lower = df["Name"].astype(str).str.strip().str.lower()
+
+    # Every rule is a plain substring, so regex=False keeps pandas off the regex engine
+    conditions = [names_lower.isin(COMPED_NAMES)]
+    conditions += [notes_lower.str.contains(needle, regex=False) for needle, _ in NOTES_STATUS_RULES]
+    choices = ["comped"] + [status for _, status in NOTES_STATUS_RULES]
+    return pd.Series(np.select(conditions, choices, default="other"), index=df.index, dtype=object)
 
 def load_global_metadata() -> dict:
     if not os.path.exists(ROOT_METADATA_PATH):
         default_data = {"clubs": DEFAULT_CLUBS}
-        with open(ROOT_METADATA_PATH, "w") as f:
-            json.dump(default_data, f, indent=4)
+        write_json_atomic(ROOT_METADATA_PATH, default_data)
         return default_data
 
     try:
-        with open(ROOT_METADATA_PATH) as f:
-            data = json.load(f)
+        with open(ROOT_METADATA_PATH, "rb") as f:
+            data = json_loads(f.read())
             if "clubs" not in data:
                 data["clubs"] = DEFAULT_CLUBS
                 save_global_metadata(data)
@@ -138,13 +720,72 @@ def load_global_metadata() -> dict:
     except Exception:
         # fallback: reset metadata file
         default_data = {"clubs": DEFAULT_CLUBS}
-        with open(ROOT_METADATA_PATH, "w") as f:
-            json.dump(default_data, f, indent=4)
+        write_json_atomic(ROOT_METADATA_PATH, default_data)
         return default_data
 
 def save_global_metadata(data: dict):
-    with open(ROOT_METADATA_PATH, "w") as f:
-        json.dump(data, f, indent=4)
+    write_json_atomic(ROOT_METADATA_PATH, data)
+
+def categorize_status_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """Stores the low-cardinality status columns as categoricals so filters compare int8 codes."""
+    if "Status" in df.columns:
+        df["Status"] = df["Status"].astype("category")
+    for col in ("default_status", "current_status"):
+        if col in df.columns:
+            # Keep hand-edited values that aren't in STATUS_LIST instead of turning them into NaN
+            extra = sorted(set(df[col].dropna().unique()) - set(STATUS_LIST), key=str)
+            df[col] = df[col].astype(pd.CategoricalDtype(STATUS_LIST + extra))
+    return df
+
+def count_statuses(statuses: pd.Series) -> Dict[str, int]:
+    """Status -> count for one file's status column, zero counts included for every category.
+
+    Categorical columns are counted with a bincount over their int codes, without hashing any strings.
+    """
+    if not isinstance(statuses.dtype, pd.CategoricalDtype):
+        return statuses.value_counts(sort=False).to_dict()
+    codes = statuses.cat.codes.to_numpy()
+    categories = statuses.cat.categories
+    counts = np.bincount(codes[codes >= 0], minlength=len(categories))  # -1 codes are missing values
+    return dict(zip(categories.tolist(), counts.tolist()))
+
+def status_counts_frame(fnames: List[str], dataframes: List[pd.DataFrame]) -> pd.DataFrame:
+    """Counts current_status per file; rows follow fnames, columns STATUS_LIST.
+
+    Each file's column is counted on its own (see count_statuses) rather than
+    concatenated into one object Series.
+    """
+    if not fnames:
+        return pd.DataFrame(0, index=[], columns=STATUS_LIST)
+    counts = pd.DataFrame(
+        [count_statuses(df["current_status"]) for df in dataframes],
+        index=fnames,
+    )
+    return counts.reindex(columns=STATUS_LIST).fillna(0).astype(np.int64)
+
+def regular_manual_counts(state: Dict, paths: List[str]) -> tuple:
+    """Per-path regular and manual counts as two arrays.
+
+    Read from state["status_counts"] (kept current by the assign screen) when it covers
+    every file, so repeated fee saves don't rescan the DataFrames.
+    """
+    fnames = [os.path.basename(p) for p in paths]
+    cached = state.get("status_counts") or {}
+    if not all(fname in cached for fname in fnames):
+        counts = status_counts_frame(fnames, [state["dataframes"][p] for p in paths])
+        cached = counts.to_dict("index")
+    regular = np.array([cached[fname].get("regular", 0) for fname in fnames], dtype=np.int64)
+    manual = np.array([cached[fname].get("manual", 0) for fname in fnames], dtype=np.int64)
+    return regular, manual
+
+def sorted_csv_paths(state: Dict) -> List[str]:
+    """state["csv_paths"] ordered by basename; re-sorted only when the path list changes."""
+    key = tuple(state["csv_paths"])
+    cached = state.get("_sorted_csv_paths")
+    if cached is None or cached[0] != key:
+        cached = (key, sorted(key, key=os.path.basename))
+        state["_sorted_csv_paths"] = cached
+    return cached[1]
 
 def is_file_flagged(df: pd.DataFrame) -> bool:
     return "current_status" in df.columns and (df["current_status"] == "other").any()
@@ -161,33 +802,122 @@ def go_back_to_program(state: Dict):
     screen_index = state.get("previous_program_screen", 0)
     state["stack"].setCurrentIndex(screen_index)
 
+@contextmanager
+def blocked(*widgets):
+    """Blocks signals on widgets for the duration, restoring each one's previous state (so nesting is safe)."""
+    previous = [w.blockSignals(True) for w in widgets]
+    try:
+        yield
+    finally:
+        for w, was_blocked in zip(widgets, previous):
+            w.blockSignals(was_blocked)
+
+def connect_for_lifetime(signal, slot, owner: QObject):
+    """signal.connect(slot), disconnected again when owner is destroyed.
+
+    For closures hooked to the app-wide state["signals"] by screens that get replaced,
+    which Qt can't otherwise tie to a receiver.
+    """
+    signal.connect(slot)
+
+    def disconnect(*_):
+        try:
+            signal.disconnect(slot)
+        except TypeError:
+            pass  # Already disconnected
+
+    owner.destroyed.connect(disconnect)
+
+def schedule_banner_refresh(state: Dict):
+    """Runs the state["_refresh_crud_banners"] callbacks once on the next event-loop turn, however often this is called before then."""
+    if state.get("_banner_refresh_scheduled"):
+        return
+    state["_banner_refresh_scheduled"] = True
+
+    def flush():
+        state["_banner_refresh_scheduled"] = False
+        for fn in state.get("_refresh_crud_banners", []):
+            fn()
+
+    QTimer.singleShot(0, flush)
+
+def refresh_or_create_screen(stack: QStackedWidget, state: Dict, index: int, factory, refresh_name: str) -> QWidget:
+    """Refreshes the program screen at index in place, only building it with factory the first time."""
+    widget = stack.widget(index)
+    refresh = getattr(widget, refresh_name, None)
+    if callable(refresh):
+        refresh()
+        return widget
+    new_screen = factory(stack, state)
+    stack.removeWidget(widget)
+    stack.insertWidget(index, new_screen)
+    return new_screen
+
 def load_club_dates() -> Dict[str, List[str]]:
     club_to_dates = {}
-    for f in os.listdir(SESSIONS_DIR):
-        session_path = os.path.join(SESSIONS_DIR, f)
-        if not os.path.isdir(session_path):
+    for entry in scan_session_dirs():
+        f = entry.name
+        metadata_path = session_metadata_path(entry.path)
+        try:
+            data = read_metadata(metadata_path)  # Unchanged files come from the metadata cache
+        except FileNotFoundError:
             continue
-        metadata_path = os.path.join(session_path, "metadata", "metadata.json")
-        if os.path.exists(metadata_path):
-            try:
-                with open(metadata_path) as m:
-                    data = json.load(m)
-                    club = data.get("club")
-                    date = data.get("date")
-                    if club and date:
-                        club_to_dates.setdefault(club, []).append(date)
-            except Exception as e:
-                print(f"[ERROR] Failed to read metadata for session {f}: {e}")
+        except Exception as e:
+            print(f"[ERROR] Failed to read metadata for session {f}: {e}")
+            continue
+        club = data.get("club")
+        date = data.get("date")
+        if club and date:
+            club_to_dates.setdefault(club, []).append(date)
     return club_to_dates
 
-def get_csv_paths_from_dir(csv_dir: str | Path) -> List[str]:
-    if not os.path.isdir(csv_dir):
+def unique_session_name(base_name: str) -> str:
+    """Returns base_name, or base_name-vN one past the highest existing version, from a single directory listing."""
+    version_re = re.compile(re.escape(base_name) + r"(?:-v(\d+))?")
+    base_taken = False
+    highest = 1
+    with os.scandir(SESSIONS_DIR) as entries:
+        for entry in entries:
+            match = version_re.fullmatch(entry.name)
+            if not match:
+                continue
+            if match.group(1) is None:
+                base_taken = True
+            else:
+                highest = max(highest, int(match.group(1)))
+    return f"{base_name}-v{highest + 1}" if base_taken else base_name
+
+def session_metadata_path(session_dir) -> str:
+    """<session>/metadata/metadata.json."""
+    return os.path.join(session_dir, "metadata", "metadata.json")
+
+def session_csv_dir(session_dir) -> str:
+    """<session>/csv."""
+    return os.path.join(session_dir, "csv")
+
+def scan_session_dirs() -> List[os.DirEntry]:
+    """The session folders in SESSIONS_DIR ([] if it doesn't exist yet), from a single directory read."""
+    try:
+        with os.scandir(SESSIONS_DIR) as it:
+            return [e for e in it if e.is_dir()]
+    except FileNotFoundError:
+        return []
+
+def scan_csv_entries(csv_dir: str | Path) -> List[os.DirEntry]:
+    """The *.csv files in csv_dir sorted by name ([] if the folder is missing).
+
+    DirEntry carries the joined path and the file type from the directory read itself.
+    """
+    try:
+        with os.scandir(csv_dir) as it:
+            entries = [e for e in it if e.name.endswith(".csv") and e.is_file()]
+    except (FileNotFoundError, NotADirectoryError):
         return []
-    return sorted([
-        os.path.join(csv_dir, f)
-        for f in os.listdir(csv_dir)
-        if f.endswith(".csv")
-    ])
+    entries.sort(key=lambda e: e.name)
+    return entries
+
+def get_csv_paths_from_dir(csv_dir: str | Path) -> List[str]:
+    return [e.path for e in scan_csv_entries(csv_dir)]
 
 def create_graphical_loader_screen(stack: QStackedWidget, state: Dict) -> QWidget:
     scr = QWidget()
@@ -259,10 +989,8 @@ def create_graphical_loader_screen(stack: QStackedWidget, state: Dict) -> QWidge
 
     def extract_club_names():
         club_names = set()
-        if not os.path.exists(SESSIONS_DIR):
-            return []
-        for folder in os.listdir(SESSIONS_DIR):
-            parts = folder.split("-")
+        for entry in scan_session_dirs():
+            parts = entry.name.split("-")
             if len(parts) >= 4 and parts[0] == "Session":
                 club = parts[1]
                 club_names.add(club)
@@ -302,30 +1030,25 @@ def create_graphical_loader_screen(stack: QStackedWidget, state: Dict) -> QWidge
         tree.setVisible(True)
 
         tree.clear()
-        for folder in sorted(os.listdir(SESSIONS_DIR)):
+        for entry in sorted(scan_session_dirs(), key=lambda e: e.name):
+            folder = entry.name
             parts = folder.split("-")
             if len(parts) >= 4 and parts[0] == "Session" and parts[1] == club:
-                session_path = os.path.join(SESSIONS_DIR, folder)
-                meta_path = os.path.join(session_path, "metadata", "metadata.json")
-                csv_path = os.path.join(session_path, "csv")
+                session_path = entry.path
+                meta_path = session_metadata_path(session_path)
+                csv_path = session_csv_dir(session_path)
                 if not os.path.exists(meta_path) or not os.path.exists(csv_path):
                     continue
                 try:
-                    with open(meta_path, "r") as f:
-                        metadata = json.load(f)
-                    paid_status = metadata.get("paid", False)
-                    status_str = "paid ✅" if paid_status else "unpaid ❌"
-                    net = metadata.get("net_to_club", None)
-                    formatted_total = f"${net:.2f}" if isinstance(net, (int, float)) else "No total yet"
+                    status_str, formatted_total = session_display_parts(meta_path)
                     display_name = f"{folder} — {status_str} — total {formatted_total}"
                 except Exception as e:
                     print(f"[ERROR] Could not read metadata for {folder}: {e}")
                     display_name = folder
                 parent_item = QTreeWidgetItem([display_name])
                 parent_item.setData(0, Qt.ItemDataRole.UserRole, session_path)
-                for fname in sorted(os.listdir(csv_path)):
-                    if fname.endswith(".csv"):
-                        QTreeWidgetItem(parent_item, [fname])
+                for csv_entry in scan_csv_entries(csv_path):
+                    QTreeWidgetItem(parent_item, [csv_entry.name])
                 tree.addTopLevelItem(parent_item)
 
     def on_tree_item_clicked(item: QTreeWidgetItem, _):
@@ -371,9 +1094,8 @@ def create_graphical_loader_screen(stack: QStackedWidget, state: Dict) -> QWidge
 
     def update_paid_status(path, status: bool):
         try:
-            meta_path = os.path.join(path, "metadata", "metadata.json")
-            with open(meta_path, "r") as f:
-                metadata = json.load(f)
+            meta_path = session_metadata_path(path)
+            metadata = dict(read_metadata(meta_path))
             metadata["paid"] = status
             write_metadata(meta_path, metadata)
 
@@ -467,14 +1189,14 @@ def create_graphical_loader_screen(stack: QStackedWidget, state: Dict) -> QWidge
     back_btn.clicked.connect(show_club_buttons)
     show_club_buttons()
     scr.is_graphical_loader = True
+    state["_graphical_loader_widget"] = scr  # The newest loader page, for the stack's currentChanged hook
     return scr
 
 def update_last_opened_metadata(session_path: str):
-        meta_path = os.path.join(session_path, "metadata", "metadata.json")
+        meta_path = session_metadata_path(session_path)
         try:
             if os.path.exists(meta_path):
-                with open(meta_path, "r") as f:
-                    metadata = json.load(f)
+                metadata = dict(read_metadata(meta_path))
             else:
                 metadata = {}
             metadata["last_opened"] = datetime.now().isoformat()
@@ -545,10 +1267,9 @@ def create_welcome_screen(stack: QStackedWidget, state: Dict) -> QWidget:
 
     # Track last opened timestamp
     def update_last_opened_metadata(session_path: str):
-        meta_path = os.path.join(session_path, "metadata", "metadata.json")
+        meta_path = session_metadata_path(session_path)
         if os.path.exists(meta_path):
-            with open(meta_path, "r") as f:
-                metadata = json.load(f)
+            metadata = dict(read_metadata(meta_path))
         else:
             metadata = {}
         metadata["last_opened"] = datetime.now().isoformat()
@@ -562,36 +1283,30 @@ def create_welcome_screen(stack: QStackedWidget, state: Dict) -> QWidget:
 
         for p in paths:
             try:
-                df = pd.read_csv(p)
-                headers = [c.strip().lower() for c in df.columns]
+                # Only the header decides the layout, so the body is parsed once, straight to text columns
+                headers = [c.strip().lower() for c in pd.read_csv(p, nrows=0).columns]
 
                 # Expected layouts (processed or raw)
                 processed_layout = ["name", "email", "phone number", "status", "registration time", "notes", "default_status", "anklebreaker notes", "current_status"]
                 raw_layout = ["name", "email", "status", "registered", "notes"]
 
                 if headers == processed_layout:
-                    dfs.append(df)  # Already processed
-                elif headers == raw_layout:
-                    df = pd.read_csv(p, skiprows=1, header=None)
-                    df.columns = ["Name", "Email", "Phone Number", "Status", "Registration Time", "Notes"]
-                    df["default_status"] = df.apply(lambda row: determine_default_status(row["Notes"], row["Name"]), axis=1)
-                    df["AnkleBreaker notes"] = ""
-                    df["current_status"] = df["default_status"]
-                    dfs.append(df)
+                    df = pd.read_csv(p, **SESSION_CSV_READ_OPTIONS)
+                    dfs.append(categorize_status_columns(df))  # Already processed
                 else:
-                    warned_files.append(os.path.basename(p))
-                    df = pd.read_csv(p, skiprows=1, header=None)
-                    df.columns = ["Name", "Email", "Phone Number", "Status", "Registration Time", "Notes"]
-                    df["default_status"] = df.apply(lambda row: determine_default_status(row["Notes"], row["Name"]), axis=1)
+                    if headers != raw_layout:
+                        warned_files.append(os.path.basename(p))
+                    df = pd.read_csv(p, skiprows=1, header=None, **SESSION_CSV_READ_OPTIONS)
+                    df.columns = SESSION_CSV_BASE_COLUMNS
+                    df["default_status"] = determine_default_statuses(df)
                     df["AnkleBreaker notes"] = ""
                     df["current_status"] = df["default_status"]
-                    dfs.append(df)
+                    dfs.append(categorize_status_columns(df))
 
             except Exception as exc:
                 errors.append(f"{p}: {exc}")
 
         state["dataframes"] = dfs
-        state["df"] = pd.concat(dfs, ignore_index=True) if dfs else None
 
         file_names = [os.path.basename(p) for p in paths]
         msg = f"Loaded {len(dfs)} file(s)"
@@ -675,36 +1390,27 @@ def create_welcome_screen(stack: QStackedWidget, state: Dict) -> QWidget:
 
     def refresh_session_tree():
         tree.clear()
-        if not os.path.exists(SESSIONS_DIR):
-            return
 
         sessions_with_time = []
-        for session_name in os.listdir(SESSIONS_DIR):
-            session_path = os.path.join(SESSIONS_DIR, session_name)
-            meta_path = os.path.join(session_path, "metadata", "metadata.json")
+        for entry in scan_session_dirs():
+            session_name = entry.name
+            meta_path = session_metadata_path(entry.path)
             if not os.path.exists(meta_path):
                 continue
-            with open(meta_path, "r") as f:
-                metadata = json.load(f)
+            metadata = read_metadata(meta_path)
             last_opened = metadata.get("last_opened", "1970-01-01T00:00:00")
-            sessions_with_time.append((session_name, last_opened))
+            sessions_with_time.append((session_name, last_opened, meta_path))
 
         sessions_with_time.sort(
             key=lambda x: datetime.fromisoformat(x[1]) if isinstance(x[1], str) else datetime.min,
             reverse=True
         )
 
-        for session_name, _ in sessions_with_time:
+        for session_name, _, meta_path in sessions_with_time:
             session_path = os.path.join(SESSIONS_DIR, session_name)
-            meta_path = os.path.join(session_path, "metadata", "metadata.json")
-            csv_path = os.path.join(session_path, "csv")
-            with open(meta_path, "r") as f:
-                metadata = json.load(f)
-            paid_status = metadata.get("paid", False)
-
-            status_text = "paid ✅" if paid_status else "unpaid ❌"
-            net_total = metadata.get("net_to_club", "No total yet")
-            formatted_total = f"${net_total:.2f}" if isinstance(net_total, (int, float)) else "No total yet"
+            csv_path = session_csv_dir(session_path)
+
+            status_text, formatted_total = session_display_parts(meta_path)
             display_name = f"{session_name} — {status_text} — Total: {formatted_total}"
 
 
@@ -713,17 +1419,19 @@ def create_welcome_screen(stack: QStackedWidget, state: Dict) -> QWidget:
             if not os.path.exists(csv_path):
                 continue
 
-            files = [
-                (fname, os.path.getmtime(os.path.join(csv_path, fname)))
-                for fname in os.listdir(csv_path)
-                if fname.endswith(".csv")
-            ]
-            files.sort(key=lambda x: x[1], reverse=True)
-
-            for fname, _ in files:
-                QTreeWidgetItem(parent_item, [fname])
+            # Newest first; DirEntry.stat() is cached per entry (and free on Windows)
+            files = sorted(scan_csv_entries(csv_path), key=lambda e: e.stat().st_mtime, reverse=True)
+            for csv_entry in files:
+                QTreeWidgetItem(parent_item, [csv_entry.name])
             tree.addTopLevelItem(parent_item)
 
+    # Coalesce bursts of refresh requests (several sessionsChanged emits per action,
+    # or a Finder/Explorer copy touching many folders) into one rebuild
+    refresh_timer = QTimer(screen)
+    refresh_timer.setSingleShot(True)
+    refresh_timer.setInterval(SESSION_REFRESH_DEBOUNCE_MS)
+    refresh_timer.timeout.connect(refresh_session_tree)
+
     def confirm_and_load_session(session_dir):
         reply = QMessageBox.question(
             screen,
@@ -740,7 +1448,11 @@ def create_welcome_screen(stack: QStackedWidget, state: Dict) -> QWidget:
     )
 
     refresh_session_tree()
-    state["signals"].sessionsChanged.connect(refresh_session_tree)
+    connect_for_lifetime(state["signals"].sessionsChanged, lambda: refresh_timer.start(), screen)
+
+    # Pick up sessions added/removed outside the app too; owned by the screen, so it goes with it
+    fs_watch = QFileSystemWatcher([str(SESSIONS_DIR)], screen)
+    fs_watch.directoryChanged.connect(lambda _path: refresh_timer.start())
 
     select_files_btn.clicked.connect(select_files)
     select_folder_btn.clicked.connect(select_folder)
@@ -827,7 +1539,7 @@ def create_session_creation_screen(stack: QStackedWidget, state) -> QWidget:
         update_status()
 
     # Attach refresh to signal
-    state["signals"].clubsChanged.connect(refresh_dropdown)
+    connect_for_lifetime(state["signals"].clubsChanged, refresh_dropdown, screen)
 
     refresh_dropdown()
 
@@ -865,13 +1577,8 @@ def create_session_creation_screen(stack: QStackedWidget, state) -> QWidget:
         state["session_created"] = True
         state["session_deleted"] = False
         
-        session_name = base_session_name
-        suffix = 2
+        session_name = unique_session_name(base_session_name)
         session_path = SESSIONS_DIR / session_name
-        while session_path.exists():
-            session_name = f"{base_session_name}-v{suffix}"
-            session_path = SESSIONS_DIR / session_name
-            suffix += 1
 
         csv_dir = session_path / "csv"
         metadata_dir = session_path / "metadata"
@@ -879,93 +1586,107 @@ def create_session_creation_screen(stack: QStackedWidget, state) -> QWidget:
         metadata_dir.mkdir(parents=True)
 
         new_paths = []
+        pending_writes = []
         for i, (df, original_path) in enumerate(zip(state["dataframes"], state["csv_paths"])):
             filename = os.path.basename(original_path)
 
             if "default_status" not in df.columns:
-                df["default_status"] = df.apply(lambda row: determine_default_status(row["Notes"], row["Name"]), axis=1)
+                df["default_status"] = determine_default_statuses(df)
 
             if "current_status" not in df.columns:
                 df["current_status"] = df["default_status"]
 
-            if any(df["current_status"] == "other"):
+            if (df["current_status"] == "other").any():
                 flagged = True
                 if not filename.endswith("-flag.csv"):
                     filename = filename.replace(".csv", "-flag.csv")
 
             new_path = csv_dir / filename
-            df.to_csv(new_path, index=False)
+            pending_writes.append((df, new_path))
             new_paths.append(str(new_path))
 
             if filename.endswith("-flag.csv"):
                 flagged_files.append(filename)
 
-        if flagged and "-flag" not in session_name:
-            session_name += "-flag"
-            final_session_path = SESSIONS_DIR / session_name
-            suffix = 2
-            while final_session_path.exists():
-                session_name = f"{session_name}-v{suffix}"
+        def on_written(tasks):
+            nonlocal session_name, session_path, new_paths
+            screen.setEnabled(True)
+            errors = [task for task in tasks if task.error is not None]
+            if errors:
+                print(f"[ERROR] Failed to write session files: {errors[0].error}")
+                QMessageBox.critical(screen, "Error", f"Failed to write session files:\n{errors[0].error}")
+                create_btn.setEnabled(True)
+                return
+
+            if flagged and "-flag" not in session_name:
+                session_name = unique_session_name(session_name + "-flag")
                 final_session_path = SESSIONS_DIR / session_name
-                suffix += 1
 
-            os.rename(session_path, final_session_path)
-            new_paths = [str(final_session_path / "csv" / os.path.basename(p)) for p in new_paths]
-            session_path = final_session_path
+                os.rename(session_path, final_session_path)
+                new_paths = [str(final_session_path / "csv" / os.path.basename(p)) for p in new_paths]
+                session_path = final_session_path
+                state["csv_paths"] = new_paths
+
+            metadata = {
+                "club": club_name,
+                "date": date_str,
+                "last_opened": datetime.now().isoformat(),
+                "flagged": flagged,
+                "flagged_files": flagged_files,
+                "fees": {},
+            }
+
+            metadata_path = session_path / "metadata" / "metadata.json"
+            write_json_atomic(metadata_path, metadata)
+
+            state["current_session"] = str(session_path)
             state["csv_paths"] = new_paths
 
-        metadata = {
-            "club": club_name,
-            "date": date_str,
-            "last_opened": datetime.now().isoformat(),
-            "flagged": flagged,
-            "flagged_files": flagged_files,
-            "fees": {},
-        }
-
-        metadata_path = session_path / "metadata" / "metadata.json"
-        with open(metadata_path, "w") as f:
-            json.dump(metadata, f, indent=4)
-
-        state["current_session"] = str(session_path)
-        state["csv_paths"] = new_paths
-
-        # Force rebuild of dataframes to avoid UI issues
-        rebuilt_dataframes = {}
-        for p in new_paths:
-            try:
-                df = pd.read_csv(p)
+            def prepare(df):
                 if "default_status" not in df.columns:
-                    df["default_status"] = df.apply(lambda row: determine_default_status(row["Notes"], row["Name"]), axis=1)
+                    df["default_status"] = determine_default_statuses(df)
                 if "current_status" not in df.columns:
                     df["current_status"] = df["default_status"]
                 if "AnkleBreaker notes" not in df.columns:
                     df["AnkleBreaker notes"] = ""
-                rebuilt_dataframes[p] = df
-            except Exception as e:
-                print(f"[ERROR] Failed to rebuild df from {p}: {e}")
+                return categorize_status_columns(df)
 
-        state["dataframes"] = rebuilt_dataframes
+            # Force rebuild of dataframes to avoid UI issues
+            def on_rebuilt(tasks):
+                screen.setEnabled(True)
+                rebuilt_dataframes = {}
+                for task in tasks:
+                    if task.error is not None:
+                        print(f"[ERROR] Failed to rebuild df from {task.path}: {task.error}")
+                        continue
+                    rebuilt_dataframes[task.path] = task.df
 
-        for fn in state.get("_refresh_crud_banners", []):
-            fn()
-        state["signals"].sessionsChanged.emit()
-        state["signals"].dataChanged.emit()
-        state["session_locked"] = True
-        # Disable upload buttons once session is locked
-        if state.get("_upload_files_btn"):
-            state["_upload_files_btn"].setEnabled(False)
-        if state.get("_upload_folder_btn"):
-            state["_upload_folder_btn"].setEnabled(False)
+                state["dataframes"] = rebuilt_dataframes
 
-        # Rebuild assign screen but DO NOT switch to it
-        # Rebuild assign screen AND switch to it
-        assign_screen = create_assign_status_screen(stack, state)
-        stack.removeWidget(stack.widget(2))
-        stack.insertWidget(2, assign_screen)
-        stack.setCurrentIndex(2)
+                schedule_banner_refresh(state)
+                state["signals"].sessionsChanged.emit()
+                state["signals"].dataChanged.emit()
+                state["session_locked"] = True
+                # Disable upload buttons once session is locked
+                if state.get("_upload_files_btn"):
+                    state["_upload_files_btn"].setEnabled(False)
+                if state.get("_upload_folder_btn"):
+                    state["_upload_folder_btn"].setEnabled(False)
+
+                # Rebuild assign screen but DO NOT switch to it
+                # Rebuild assign screen AND switch to it
+                assign_screen = create_assign_status_screen(stack, state)
+                stack.removeWidget(stack.widget(2))
+                stack.insertWidget(2, assign_screen)
+                stack.setCurrentIndex(2)
+
+            screen.setEnabled(False)
+            start_csv_reads(new_paths, on_rebuilt, prepare)
 
         create_btn.setEnabled(False)  # ⛔ Prevent creating again without reset
+        # All files must be on disk before the folder can be renamed in on_written
+        screen.setEnabled(False)
+        start_csv_writes(pending_writes, on_written)
 
     create_btn.clicked.connect(show_confirmation_dialog)
 
@@ -1020,8 +1741,8 @@ def create_session_creation_screen(stack: QStackedWidget, state) -> QWidget:
 #This is the third scrren that the user sees and is the first step after a session is created
 #A user cannot backtrack past this screen
 def create_assign_status_screen(stack, state) -> QWidget:
-    # Completely replace scroll content and layout
     screen = QWidget()
+    screen.is_assign_screen = True
     main_layout = QHBoxLayout(screen)
 
     session_csvs = []
@@ -1034,22 +1755,48 @@ def create_assign_status_screen(stack, state) -> QWidget:
     file_dropdown = QComboBox()
     file_dropdown.installEventFilter(state["_wheel_filter"])
 
-    def make_scroll_content():
-        container = QWidget()
-        layout = QVBoxLayout(container)
-        container.setLayout(layout)
-        container.setMinimumWidth(760)
-        container.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
-        return container, layout
+    person_model = PersonStatusModel(state["dataframes"])
+    person_view = QTableView()
+    person_view.setModel(person_model)
+    person_model.setParent(person_view)
+    person_view.setItemDelegateForColumn(PersonStatusModel.STATUS_COLUMN, StatusButtonsDelegate(person_view))
+    person_view.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+    person_view.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+    person_view.verticalHeader().setVisible(False)
+    person_view.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+    person_view.verticalHeader().setDefaultSectionSize(44)
+    person_header = person_view.horizontalHeader()
+    person_header.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+    person_header.setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
+    person_header.setSectionResizeMode(PersonStatusModel.STATUS_COLUMN, QHeaderView.ResizeMode.Fixed)
+    person_view.setColumnWidth(PersonStatusModel.STATUS_COLUMN, len(STATUS_LIST) * 116 + 12)
+    person_view.setMinimumWidth(760)
+    open_editor_rows = set()
+
+    def sync_visible_editors(*_):
+        """Keeps persistent status editors open only on the rows currently in the viewport."""
+        rows = person_model.rowCount()
+        if not rows:
+            open_editor_rows.clear()
+            return
+        first = person_view.rowAt(0)
+        last = person_view.rowAt(person_view.viewport().height() - 1)
+        first = 0 if first < 0 else first
+        last = rows - 1 if last < 0 else last
+        visible = set(range(first, last + 1))
+        for row in open_editor_rows - visible:
+            person_view.closePersistentEditor(person_model.index(row, PersonStatusModel.STATUS_COLUMN))
+        for row in visible - open_editor_rows:
+            person_view.openPersistentEditor(person_model.index(row, PersonStatusModel.STATUS_COLUMN))
+        open_editor_rows.clear()
+        open_editor_rows.update(visible)
 
-    
-    scroll = QScrollArea()
-    scroll.setWidgetResizable(True)
-    scroll_content, scroll_layout = make_scroll_content()
-    scroll.setWidget(scroll_content)
-    status_table = QTableWidget()
-    status_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
-    status_table.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+    person_model.modelReset.connect(open_editor_rows.clear)
+    person_view.verticalScrollBar().valueChanged.connect(sync_visible_editors)
+    person_view.verticalScrollBar().rangeChanged.connect(sync_visible_editors)
+    status_model = StatusCountsModel(np.zeros((0, len(STATUS_LIST)), dtype=np.int64), [s.capitalize() for s in STATUS_LIST], [])
+    status_table = make_summary_table(status_model)
+    status_table.verticalHeader().setDefaultSectionSize(50)
 
 
 
@@ -1093,17 +1840,14 @@ def create_assign_status_screen(stack, state) -> QWidget:
 
     
 
-    # 👇 Key line for consistency
-    scroll_content.setMinimumWidth(760)  # or whatever matches View All layout width
-    scroll_content.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
-    scroll.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+    person_view.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
 
     file_dropdown_container = QWidget()
     file_dropdown_container.setLayout(file_dropdown_row)
     file_dropdown_container.setContentsMargins(0, 0, 0, 0)
 
     left_layout.addWidget(file_dropdown_container)
-    left_layout.addWidget(scroll)
+    left_layout.addWidget(person_view)
     left_layout.setSpacing(6)  # optional: reduce vertical spacing
 
     
@@ -1168,7 +1912,7 @@ def create_assign_status_screen(stack, state) -> QWidget:
     if not session_path:
         return screen  # Or show an error, or skip loading
 
-    csv_dir = os.path.join(session_path, "csv")
+    csv_dir = session_csv_dir(session_path)
 
     csv_paths = get_csv_paths_from_dir(csv_dir)
     state["csv_paths"] = csv_paths
@@ -1187,28 +1931,25 @@ def create_assign_status_screen(stack, state) -> QWidget:
 
         # Fallback to loading from disk
         if current_session and os.path.exists(current_session):
-            csv_dir = os.path.join(current_session, "csv")
+            csv_dir = session_csv_dir(current_session)
         else:
-            folders = [
-                os.path.join(SESSIONS_DIR, f)
-                for f in os.listdir(SESSIONS_DIR)
-                if os.path.isdir(os.path.join(SESSIONS_DIR, f))
-            ]
-            latest_session = max(folders, key=os.path.getctime, default=None)
-            csv_dir = os.path.join(latest_session, "csv") if latest_session else None
+            latest_session = max(scan_session_dirs(), key=lambda entry: entry.stat().st_ctime, default=None)
+            csv_dir = session_csv_dir(latest_session.path) if latest_session else None
 
         if csv_dir and os.path.exists(csv_dir):
-            for path in get_csv_paths_from_dir(csv_dir):
-                if path.endswith(".csv"):
-                    path = os.path.join(csv_dir, path)
-                    df = pd.read_csv(path)
-                    if "default_status" in df.columns:
-                        if "current_status" not in df.columns:
-                            df["current_status"] = df["default_status"]
-                        if path not in csv_paths:
-                            dataframes.append(df)
-                            session_csvs.append(path)
-                            dataframes_dict[path] = df
+            # get_csv_paths_from_dir already filters to *.csv and joins csv_dir; files are parsed in parallel
+            for task in run_csv_reads(get_csv_paths_from_dir(csv_dir)):
+                if task.error is not None:
+                    raise task.error
+                path, df = task.path, task.df
+                if "default_status" in df.columns:
+                    if "current_status" not in df.columns:
+                        df["current_status"] = df["default_status"]
+                    categorize_status_columns(df)
+                    if path not in csv_paths:
+                        dataframes.append(df)
+                        session_csvs.append(path)
+                        dataframes_dict[path] = df
 
         state["csv_paths"] = csv_paths
         state["dataframes"] = dataframes_dict
@@ -1240,22 +1981,19 @@ def create_assign_status_screen(stack, state) -> QWidget:
                             assign_screen = state.get("assign_status_screen")
                             if assign_screen and hasattr(assign_screen, "refresh_file_dropdown"):
                                 assign_screen.refresh_file_dropdown()
-                        elif screen_index == 3:
-                            new_screen = create_fee_schedule_screen(stack, state)
-                            stack.removeWidget(widget)
-                            stack.insertWidget(3, new_screen)
-                        elif screen_index == 4:
-                            summary_screen = create_payment_summary_screen(stack, state)
-                            stack.removeWidget(stack.widget(4))
-                            stack.insertWidget(4, summary_screen)
+                        elif screen_index == 3 and hasattr(widget, "refresh_file_dropdown"):
+                            widget.refresh_file_dropdown()
+                        elif screen_index == 4 and hasattr(widget, "refresh_summary"):
+                            widget.refresh_summary()
                     # Emit signal to trigger any reactive UI
                     state["signals"].sessionsChanged.emit()  # ✅ triggers QTreeWidgets
                     state["signals"].dataChanged.emit()
 
     def update_flag_state_for_file(csv_path, state, stack):
         # Step 0: Normalize csv_path to match real path in state
+        target_basename = os.path.basename(csv_path)
         for p in state["csv_paths"]:
-            if os.path.basename(p) == os.path.basename(csv_path):
+            if os.path.basename(p) == target_basename:
                 csv_path = p
                 break
 
@@ -1264,24 +2002,22 @@ def create_assign_status_screen(stack, state) -> QWidget:
             print("[WARNING] No dataframe found for path:", csv_path)
             return
 
-        still_flagged = (df["current_status"] == "other").any()
-        is_flagged_file = "-flag.csv" in os.path.basename(csv_path)
-        if not is_flagged_file or still_flagged:
+        old_basename = os.path.basename(csv_path)
+        is_flagged_file = old_basename.endswith("-flag.csv")
+        if not is_flagged_file or (df["current_status"] == "other").any():
             return  # Nothing to do
 
         # Paths and names
-        old_basename = os.path.basename(csv_path)
-        unflagged_path = re.sub(r"-flag(?=\.csv$)", "", csv_path)
+        unflagged_path = FLAG_SUFFIX_RE.sub("", csv_path)
         new_basename = os.path.basename(unflagged_path)
         session_path = os.path.dirname(os.path.dirname(csv_path))
         original_session = state.get("current_session")
-        meta_path = os.path.join(session_path, "metadata", "metadata.json")
+        meta_path = session_metadata_path(session_path)
 
-        # Load metadata
+        # Load metadata (copied, since the fees/flagged_files below are edited in place)
         metadata = {}
         if os.path.exists(meta_path):
-            with open(meta_path, "r") as f:
-                metadata = json.load(f)
+            metadata = copy.deepcopy(read_metadata(meta_path))
 
         # Access check
         if not (os.path.exists(csv_path) and os.access(csv_path, os.W_OK)):
@@ -1297,15 +2033,15 @@ def create_assign_status_screen(stack, state) -> QWidget:
 
         # Flush to file just in case
         try:
-            df.to_csv(csv_path, index=False)
-            print("[DEBUG] Flushed file with to_csv before rename.")
+            write_session_csv(df, csv_path)
+            print("[DEBUG] Flushed file before rename.")
         except Exception as e:
             print(f"[DEBUG] Could not flush file before rename: {e}")
 
         # Step 1: Rename file on disk FIRST
         if os.path.exists(unflagged_path):
             try:
-                os.remove(unflagged_path)
+                remove_session_csv(unflagged_path)
                 print(f"[CLEANUP] Removed existing file at {unflagged_path}")
             except Exception as e:
                 print(f"[ERROR] Could not remove existing file at {unflagged_path}: {e}")
@@ -1314,7 +2050,7 @@ def create_assign_status_screen(stack, state) -> QWidget:
         try:
             for attempt in range(3):
                 try:
-                    os.rename(csv_path, unflagged_path)
+                    rename_session_csv(csv_path, unflagged_path)
                     print(f"[RENAME SUCCESS] File renamed to: {unflagged_path}")
                     break
                 except Exception as e:
@@ -1340,9 +2076,6 @@ def create_assign_status_screen(stack, state) -> QWidget:
         state["signals"].sessionsChanged.emit()
         state["signals"].dataChanged.emit()
 
-        # Refresh dropdown
-        if hasattr(stack.widget(2), "refresh_file_dropdown"):
-            stack.widget(2).refresh_file_dropdown()
         # Step 4: Rename session folder if needed
         if "-flag" in original_session and not metadata["flagged"]:
             new_session_path = original_session.replace("-flag", "")
@@ -1351,30 +2084,30 @@ def create_assign_status_screen(stack, state) -> QWidget:
                     if not os.access(original_session, os.W_OK):
                         QMessageBox.warning(None, "Folder Locked",
                             f"The folder '{original_session}' is not accessible.\n\nPlease close any programs or File Explorer windows that may be using it, then try again.")
+                        if hasattr(stack.widget(2), "refresh_file_dropdown"):
+                            stack.widget(2).refresh_file_dropdown()  # The file itself was still renamed
                         return
                     os.rename(original_session, new_session_path)
                     print(f"[SESSION RENAME] Folder: {original_session} → {new_session_path}")
                     state["current_session"] = new_session_path
-                    # Update all state paths
-                    state["csv_paths"] = [p.replace(original_session, new_session_path) for p in state["csv_paths"]]
-                    state["dataframes"] = {
-                        p.replace(original_session, new_session_path): df
-                        for p, df in state["dataframes"].items()
-                    }
-                    state["status_counts"] = {
-                        os.path.basename(p.replace(original_session, new_session_path)): val
-                        for p, val in state["status_counts"].items()
-                    }
-                    state["fee_schedule"] = {
-                        os.path.basename(p.replace(original_session, new_session_path)): price
-                        for p, price in state["fee_schedule"].items()
+                    # Update all state paths in one pass; status_counts/fee_schedule are keyed
+                    # by basename, which the folder rename leaves unchanged
+                    renamed = {
+                        p: p.replace(original_session, new_session_path)
+                        for p in (*state["csv_paths"], *state["dataframes"])
                     }
+                    state["csv_paths"] = [renamed[p] for p in state["csv_paths"]]
+                    state["dataframes"] = {renamed[p]: df for p, df in state["dataframes"].items()}
 
                     session_path = new_session_path
-                    meta_path = os.path.join(session_path, "metadata", "metadata.json")
+                    meta_path = session_metadata_path(session_path)
                 except Exception as e:
                     print("[ERROR] Failed to rename session folder:", e)
 
+        # Refresh dropdown only now, so the view is rebound to the final (post-folder-rename) paths
+        if hasattr(stack.widget(2), "refresh_file_dropdown"):
+            stack.widget(2).refresh_file_dropdown()
+
         # Step 5: Save updated metadata
         try:
             os.makedirs(os.path.dirname(meta_path), exist_ok=True)
@@ -1391,212 +2124,113 @@ def create_assign_status_screen(stack, state) -> QWidget:
         state["signals"].dataChanged.emit()
 
     def update_other_display():
-        content = ""
-        has_other = False
+        chunks = []
         for fname, df in zip(session_csvs, dataframes):
-            others = df[df["current_status"] == "other"]["Name"].tolist()
+            others = df.loc[df["current_status"] == "other", "Name"].tolist()
             if others:
-                has_other = True
-                content += f"{fname}:\n"
-                for name in others:
-                    content += f"  {name}\n"
-        other_display.setText(content.strip())
+                chunks.append(f"{fname}:")
+                chunks.extend(f"  {name}" for name in others)
+        has_other = bool(chunks)
+        other_display.setText("\n".join(chunks))
         next_btn.setEnabled(not has_other)
         return has_other
 
     def update_status_counts():
-        counts_per_file = {}
-        for fname, df in zip(session_csvs, dataframes):
-            counts = df["current_status"].value_counts().to_dict()
-            counts_per_file[fname] = counts
-        state["status_counts"] = counts_per_file
-
-        # Populate status_table
-        statuses = STATUS_LIST
-
-        row_count = len(counts_per_file)
-        status_table.setRowCount(row_count + 1)  # +1 for totals
-        for i in range(row_count + 1):
-            status_table.setRowHeight(i, 50)  # 🔥 Adjust this value as needed (e.g., 40 for extra padding)
-
-        status_table.setColumnCount(len(statuses))
-        status_table.setHorizontalHeaderLabels([s.capitalize() for s in statuses])
-        status_table.setVerticalHeaderLabels(list(counts_per_file.keys()) + ["Total"])
-
-        # Fill data rows
-        totals = {status: 0 for status in statuses}
-        for row_idx, (fname, counts) in enumerate(counts_per_file.items()):
-            for col_idx, status in enumerate(statuses):
-                val = counts.get(status, 0)
-                item = QTableWidgetItem(str(val))
-                item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                status_table.setItem(row_idx, col_idx, item)
-                totals[status] += val
-
-        # Fill totals row
-        for col_idx, status in enumerate(statuses):
-            total_val = totals[status]
-            item = QTableWidgetItem(str(total_val))
-            item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            status_table.setItem(row_count, col_idx, item)
-
-        status_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
-
-    def update_person_buttons(df_index):
-    # Fully replace scroll content with new widget + layout
-
-        new_scroll_content, new_scroll_layout = make_scroll_content()
-
-        new_scroll_content.setMinimumWidth(760)
-        new_scroll_content.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
-
-        scroll.setWidget(new_scroll_content)
-
-
-
-        state["_scroll_content"] = new_scroll_content
-        state["_scroll_layout"] = new_scroll_layout
-
-        selected_file = file_dropdown.currentText()
-
-        def make_status_buttons(row, handler_fn):
-            button_row = QHBoxLayout()
-            button_group = QButtonGroup(screen)
-            button_group.setExclusive(True)
-            for status in STATUS_LIST:
-                btn = QPushButton(status.replace("_", " ").capitalize())
-                btn.setFixedWidth(110)
-                btn.setFixedHeight(32)
-                btn.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
-                btn.setCheckable(True)
-                if row["current_status"] == status:
-                    btn.setChecked(True)
-                btn.clicked.connect(handler_fn(status))
-                button_group.addButton(btn)
-                button_row.addWidget(btn)
-            wrapper = QWidget()
-            wrapper.setLayout(button_row)
-            wrapper.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
-            wrapper.setMinimumWidth(600)
-            return wrapper
-
-        if selected_file == "View All":
-            grouped_rows = defaultdict(list)
-            for path in state["csv_paths"]:
-                df = state["dataframes"][path].copy()
-                basename = os.path.basename(path)
-                df["__source_file__"] = basename
-                grouped_rows[basename].extend(df.to_dict("records"))
-
-            for fname in sorted(grouped_rows):
-                new_scroll_layout.addWidget(QLabel(f"======== {fname} ========"))
-                for row in grouped_rows[fname]:
-                    person_box = QVBoxLayout()
-                    person_box.addWidget(QLabel(f"{row['Name']} — Default: {row['default_status']}"))
-                    def handler_fn(status, person=row):
-                        def handler():
-                            # target only the file this row came from
-                            src_base = person.get("__source_file__")
-                            # find the full path for this basename
-                            target_path = next(
-                                (p for p in state["csv_paths"] if os.path.basename(p) == src_base),
-                                None
-                            )
-                            if not target_path:
-                                return  # safety
-
-                            df = state["dataframes"][target_path]
-                            match = df[(df["Name"] == person["Name"]) & (df["Email"] == person["Email"])]
-                            if not match.empty:
-                                df.at[match.index[0], "current_status"] = status
-                                update_other_display()
-                                update_status_counts()
-                                update_flag_state_for_file(target_path, state, stack)
-                                state["signals"].dataChanged.emit()
-                        return handler
-
-                    person_box.addWidget(make_status_buttons(row, handler_fn))
-                    wrapper = QFrame()
-                    wrapper.setLayout(person_box)
-                    wrapper.setFrameShape(QFrame.Shape.StyledPanel)  # ✅ add this
-                    wrapper.setContentsMargins(12, 8, 12, 8)
-                    wrapper.setMinimumWidth(760)
-                    wrapper.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
-
-                    new_scroll_layout.addWidget(wrapper)
-
-            update_status_counts()
-            return
-
-        # --- Single file view ---
-        if df_index == 0 or df_index > len(dataframes):
-            print(f"[WARNING] Invalid df_index={df_index}")
+        counts_df = status_counts_frame(session_csvs, dataframes)
+        state["status_counts"] = counts_df.to_dict("index")
+        show_status_counts()
+
+    def show_status_counts():
+        counts = state["status_counts"]
+        if any(fname not in counts for fname in session_csvs):
+            update_status_counts()  # Files were renamed or added since the last full count
             return
+        values = np.array([[counts[fname][s] for s in STATUS_LIST] for fname in session_csvs], dtype=np.int64)
+        values = values.reshape(len(session_csvs), len(STATUS_LIST))
+        # Totals row goes last; the model is reset in one go instead of item by item
+        status_model.set_values(
+            np.vstack([values, values.sum(axis=0)]),
+            [s.capitalize() for s in STATUS_LIST],
+            list(session_csvs) + ["Total"],
+        )
 
-        try:
-            path = state["csv_paths"][df_index - 1]
-            df = state["dataframes"][path]
-        except Exception as e:
-            print(f"[ERROR] {e}")
+    def bump_status_count(path, previous, status):
+        """Moves one registrant between status columns instead of recounting every file."""
+        counts = state.get("status_counts", {}).get(os.path.basename(path))
+        if counts is None or previous not in counts or status not in counts:
+            update_status_counts()
             return
+        counts[previous] -= 1
+        counts[status] += 1
+        show_status_counts()
+
+    def on_person_status_changed(path, idx, previous, status):
+        # The model may still hold a path from before a rename; match it by basename like Step 0 above
+        if path not in state["dataframes"]:
+            path = next((p for p in state["csv_paths"] if os.path.basename(p) == os.path.basename(path)), path)
+        if file_dropdown.currentText() != "View All" and path in state["dataframes"]:
+            write_session_csv(state["dataframes"][path], path)
+        update_other_display()
+        bump_status_count(path, previous, status)
+        update_flag_state_for_file(path, state, stack)
+        state["signals"].dataChanged.emit()
 
-        for idx, row in df.iterrows():
-            person_box = QVBoxLayout()
-            person_box.addWidget(QLabel(f"{row['Name']} — Default: {row['default_status']}"))
-            def handler_fn(status, row_idx=idx, df=df):
-                def handler():
-                    df.at[row_idx, "current_status"] = status
-                    df.to_csv(path, index=False)
-                    update_other_display()
-                    update_status_counts()
-                    update_flag_state_for_file(path, state, stack)
-                    state["signals"].dataChanged.emit()
-                return handler
-            person_box.addWidget(make_status_buttons(row, handler_fn))
-            wrapper = QFrame()
-            wrapper.setLayout(person_box)
-            wrapper.setFrameShape(QFrame.Shape.StyledPanel)
-            wrapper.setContentsMargins(12, 8, 12, 8)
-            wrapper.setMinimumWidth(760)
-            wrapper.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
-            new_scroll_layout.addWidget(wrapper)
-            new_scroll_layout.addSpacing(4)  # Or 8 for more room
+    person_model.statusChanged.connect(on_person_status_changed)
 
+    def update_person_buttons(df_index):
+        """Points the person view at the selected file (or every file) and reopens editors for visible rows."""
+        if file_dropdown.currentText() == "View All":
+            paths = sorted_csv_paths(state)
+            person_view.setColumnHidden(0, False)
+        else:
+            if df_index == 0 or df_index > len(dataframes):
+                print(f"[WARNING] Invalid df_index={df_index}")
+                return
+            try:
+                paths = [state["csv_paths"][df_index - 1]]
+            except Exception as e:
+                print(f"[ERROR] {e}")
+                return
+            person_view.setColumnHidden(0, True)
 
+        person_model.set_rows(state["dataframes"], paths)
+        person_view.scrollToTop()
+        sync_visible_editors()
         update_status_counts()
 
-    def save_all_dataframes():
-        for i, path in enumerate(state["csv_paths"]):
+    def dataframe_save_jobs():
+        jobs = []
+        for path in state["csv_paths"]:
             df = state["dataframes"].get(path)
             if df is None:
                 print(f"[WARNING] No DataFrame found for path: {path}")
                 continue
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            jobs.append((df, path))
+        return jobs
 
+    def apply_save_results(tasks):
+        for task in tasks:
+            df, path, e = task.df, task.path, task.error
             folder = os.path.dirname(path)
-            try:
-                os.makedirs(folder, exist_ok=True)
-                df.to_csv(path, index=False)
+            if e is None:
                 print(f"[SAVED] {path} with statuses:\n{df[['Name', 'current_status']]}")
+            elif isinstance(e, OSError) and "non-existent directory" in str(e) and "-flag" in folder:
+                unflagged_folder = folder.replace("-flag", "")
+                new_path = os.path.join(unflagged_folder, os.path.basename(path))
+                os.makedirs(unflagged_folder, exist_ok=True)
+                write_session_csv(df, new_path)
 
-            except OSError as e:
-                if "non-existent directory" in str(e) and "-flag" in folder:
-                    unflagged_folder = folder.replace("-flag", "")
-                    new_path = os.path.join(unflagged_folder, os.path.basename(path))
-                    os.makedirs(unflagged_folder, exist_ok=True)
-                    df.to_csv(new_path, index=False)
-
-                    # Remove old flagged file to prevent duplication
-                    if os.path.exists(path):
-                        os.remove(path)
+                # Remove old flagged file to prevent duplication
+                if os.path.exists(path):
+                    remove_session_csv(path)
 
-                    # Update the path in state
-                    state["csv_paths"][i] = new_path
-                    state["dataframes"][new_path] = df
-                    del state["dataframes"][path]
-                else:
-                    raise
+                # Update the path in state
+                state["csv_paths"][state["csv_paths"].index(path)] = new_path
+                state["dataframes"][new_path] = df
+                del state["dataframes"][path]
+            else:
+                raise e
 
     file_dropdown.addItem("View All")
     file_dropdown.addItems(session_csvs)
@@ -1606,11 +2240,23 @@ def create_assign_status_screen(stack, state) -> QWidget:
         update_other_display()
 
     def go_to_fee_schedule():
-        save_all_dataframes()
-        fee_screen = create_fee_schedule_screen(stack, state)
-        stack.removeWidget(stack.widget(3))
-        stack.insertWidget(3, fee_screen)
-        stack.setCurrentIndex(3)
+        # Writes run on the thread pool; lock the editors so nothing changes mid-save
+        next_btn.setEnabled(False)
+        person_view.setEnabled(False)
+
+        def on_saved(tasks):
+            person_view.setEnabled(True)
+            next_btn.setEnabled(True)
+            try:
+                apply_save_results(tasks)
+            except Exception as e:
+                print(f"[ERROR] Failed to save session files: {e}")
+                QMessageBox.critical(screen, "Error", f"Failed to save session files:\n{e}")
+                return
+            refresh_or_create_screen(stack, state, 3, create_fee_schedule_screen, "refresh_file_dropdown")
+            stack.setCurrentIndex(3)
+
+        start_csv_writes(dataframe_save_jobs(), on_saved)
 
     next_btn.clicked.connect(go_to_fee_schedule)
     left_container = QWidget()
@@ -1636,11 +2282,8 @@ def create_assign_status_screen(stack, state) -> QWidget:
 
         update_other_display()
 
-        # Force rerender for View All mode
-        current_text = file_dropdown.currentText()
-        if current_text == "View All":
-            file_dropdown.setCurrentText("View All")
-            update_person_buttons(0)
+        # Rebind the view so it never holds paths from before a rename
+        update_person_buttons(file_dropdown.currentIndex())
 
     screen.refresh_file_dropdown = refresh_file_dropdown
     next_btn.setEnabled(False)  # default state until verified
@@ -1661,8 +2304,6 @@ def create_fee_schedule_screen(stack, state) -> QWidget:
     validator = QDoubleValidator(0.0, 10000.0, 2)
     validator.setNotation(QDoubleValidator.Notation.StandardNotation)
 
-    csv_paths = state.get("csv_paths", [])
-    saved_prices = {}
     nav_row = QHBoxLayout()
 
     def save_and_go_back():
@@ -1689,57 +2330,67 @@ def create_fee_schedule_screen(stack, state) -> QWidget:
         # Update metadata again before going forward
         save_fee_schedule()
 
-        summary_screen = create_payment_summary_screen(stack, state)
-        stack.removeWidget(stack.widget(4))
-        stack.insertWidget(4, summary_screen)
+        refresh_or_create_screen(stack, state, 4, create_payment_summary_screen, "refresh_summary")
         stack.setCurrentIndex(4)
 
-    session_dir = state.get("current_session")
-    if session_dir:
-        metadata_path = os.path.join(session_dir, "metadata", "metadata.json")
-        if os.path.exists(metadata_path):
-            try:
-                with open(metadata_path, "r") as f:
-                    meta = json.load(f)
-                    saved_prices = meta.get("fees", {})
-            except:
-                pass
-
     file_form = QFormLayout()
     layout.addLayout(file_form)
+    no_files_label = QLabel("⚠️ No CSV files found for this session.")
+    layout.addWidget(no_files_label)
+    invalid_fees = set()  # Names of files whose fee input doesn't hold a number >= 0
+
+    def is_valid_fee(text: str) -> bool:
+        try:
+            return float(text.strip()) >= 0
+        except ValueError:
+            return False
+
+    def on_fee_text_changed(fname: str, text: str):
+        # Per keystroke only the edited input is rechecked
+        if is_valid_fee(text):
+            invalid_fees.discard(fname)
+        else:
+            invalid_fees.add(fname)
+        next_btn.setEnabled(not invalid_fees)
+
     def update_next_button_state():
-        all_valid = True
-        for inp in fee_inputs.values():
-            text = inp.text().strip()
-            try:
-                value = float(text)
-                if value < 0:
-                    all_valid = False
-                    break
-            except ValueError:
-                all_valid = False
-                break
-        next_btn.setEnabled(all_valid)
+        invalid_fees.clear()
+        invalid_fees.update(fname for fname, inp in fee_inputs.items() if not is_valid_fee(inp.text()))
+        next_btn.setEnabled(not invalid_fees)
 
-    if not csv_paths:
-        layout.addWidget(QLabel("⚠️ No CSV files found for this session."))
-    else:
+    def populate_fee_inputs():
+        fee_schedule = state.setdefault("fee_schedule", {})  # May have been cleared by a session reset
+        saved_prices = {}
+        session_dir = state.get("current_session")
+        if session_dir:
+            metadata_path = session_metadata_path(session_dir)
+            if os.path.exists(metadata_path):
+                try:
+                    saved_prices = read_metadata(metadata_path).get("fees", {})
+                except:
+                    pass
+
+        while file_form.rowCount():
+            file_form.removeRow(0)
+        fee_inputs.clear()
+
+        csv_paths = state.get("csv_paths", [])
+        no_files_label.setVisible(not csv_paths)
         for path in csv_paths:
             fname = os.path.basename(path)
             inp = QLineEdit()
             inp.setValidator(validator)
             inp.setPlaceholderText("Enter cost")
-            if fname in saved_prices:
-                inp.setText(f"{float(saved_prices[fname]):.2f}")
-            else:
-                inp.setText("10.00")
+            price = saved_prices.get(fname, fee_schedule.get(fname, 10.0))
+            inp.setText(f"{float(price):.2f}")
 
             file_form.addRow(QLabel(fname), inp)
             fee_inputs[fname] = inp
-            inp.textChanged.connect(update_next_button_state)
+            inp.textChanged.connect(lambda text, fname=fname: on_fee_text_changed(fname, text))
         update_next_button_state()
 
-            
+    populate_fee_inputs()
+
 
     layout.addWidget(QLabel("Bulk Assign to All:"))
     bulk_input = QLineEdit()
@@ -1750,19 +2401,19 @@ def create_fee_schedule_screen(stack, state) -> QWidget:
     # --- Logic to enable/disable Next button ---
 
     def save_fee_schedule():
+        session_dir = state.get("current_session")
         if not session_dir:
             QMessageBox.warning(screen, "No Session", "No active session to save fees to.")
             return
 
-        metadata_path = os.path.join(session_dir, "metadata", "metadata.json")
+        metadata_path = session_metadata_path(session_dir)
         if not os.path.exists(metadata_path):
             QMessageBox.warning(screen, "Missing Metadata", "Metadata file not found in current session.")
             return
 
         # Load metadata to check if session is paid
         try:
-            with open(metadata_path, "r") as f:
-                meta = json.load(f)
+            meta = dict(read_metadata(metadata_path))  # Copy: fees and net_to_club are replaced below
         except Exception as e:
             QMessageBox.critical(screen, "Error", f"Could not read metadata:\n{e}")
             return
@@ -1782,44 +2433,31 @@ def create_fee_schedule_screen(stack, state) -> QWidget:
 
         try:
             # Calculate net_to_club using current pricing
-            total_net = 0.0
-            for path in state.get("csv_paths", []):
-                fname = os.path.basename(path)
-                price = prices.get(fname, 0)
-                df = state["dataframes"].get(path)
-                if df is None:
-                    continue
-
-                regular = (df["current_status"] == "regular").sum()
-                manual  = (df["current_status"] == "manual").sum()
-
-                gross = (regular + manual) * price
-                tih_cut = gross * 0.10
-
-                paypal = 0.0
-                for _ in range(regular):
-                    if price <= 10:
-                        paypal += price * 0.05 + 0.09
-                    else:
-                        paypal += price * 0.0349 + 0.49
-
-                net = gross - tih_cut - paypal
-                total_net += net
+            paths = [p for p in state.get("csv_paths", []) if state["dataframes"].get(p) is not None]
+            fnames = [os.path.basename(p) for p in paths]
+            regular, manual = regular_manual_counts(state, paths)
+            file_prices = [prices.get(fname, 0) for fname in fnames]
+            financials = compute_financials(file_prices, regular, manual)
+            total_net = float(financials[:, 3].sum())
+
+            # Back/Next/Assign All save again even when nothing changed; if the stored values already
+            # match, skip the write, the "Saved" box and the session-tree/file-tab reloads alike
+            if meta.get("fees") == prices and meta.get("net_to_club") == round(total_net, 2):
+                return
 
             meta["fees"] = prices
             meta["net_to_club"] = round(total_net, 2)
 
-            with open(metadata_path, "w") as f:
-                json.dump(meta, f, indent=4)
+            write_json_atomic(metadata_path, meta)
+            remember_metadata(metadata_path, meta)
 
             QMessageBox.information(screen, "Saved", "Fee schedule and net-to-club saved to metadata.")
             state["signals"].sessionsChanged.emit()
+            state["signals"].dataChanged.emit()
 
         except Exception as e:
             QMessageBox.critical(screen, "Error", f"Failed to save fees:\n{e}")
 
-        state["signals"].dataChanged.emit()
-
     def assign_all():
         val = bulk_input.text().strip()
         if not val:
@@ -1834,10 +2472,14 @@ def create_fee_schedule_screen(stack, state) -> QWidget:
         if confirm != QMessageBox.StandardButton.Yes:
             return
 
+        # One validity pass and one save for the whole batch, not a textChanged per field
+        text = f"{float(val):.2f}"
         for field in fee_inputs.values():
-            field.setText(f"{float(val):.2f}")
-        save_fee_schedule()
+            field.blockSignals(True)
+            field.setText(text)
+            field.blockSignals(False)
         update_next_button_state()
+        save_fee_schedule()
 
 
     """
@@ -1872,27 +2514,10 @@ def create_fee_schedule_screen(stack, state) -> QWidget:
 
     layout.addLayout(nav_row)
 
-    # Refresh method (if used elsewhere)
-    def refresh_file_dropdown():
-        nonlocal file_form, fee_inputs
-        file_form = QFormLayout()
-        file_basenames = [os.path.basename(p) for p in state.get("csv_paths", [])]
-        fee_inputs.clear()
-        for fname in file_basenames:
-            inp = QLineEdit()
-            inp.setValidator(validator)
-            inp.setPlaceholderText("Enter cost")
-            saved_price = state.get("fee_schedule", {}).get(fname)
-            if saved_price is not None:
-                inp.setText(f"{float(saved_price):.2f}")
-            file_form.addRow(QLabel(fname), inp)
-            fee_inputs[fname] = inp
-        update_next_button_state()
-
     layout.addStretch()  # optional but nice
 
     screen.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
-    screen.refresh_file_dropdown = refresh_file_dropdown
+    screen.refresh_file_dropdown = populate_fee_inputs
     return screen
 
 def create_payment_summary_screen(stack, state) -> QWidget:
@@ -1949,37 +2574,76 @@ def create_payment_summary_screen(stack, state) -> QWidget:
     summary_container = QVBoxLayout(summary_container_widget)
     layout.addWidget(summary_container_widget)
 
-    def build_payment_summary(mode="sorted"):
-        def clear_layout(layout: QLayout):
-            while layout.count():
-                item = layout.takeAt(0)
-                if item.widget():
-                    item.widget().deleteLater()
-                elif item.layout():
-                    clear_layout(item.layout())
-                    item.layout().deleteLater()
+    summary_models = []  # (StatusCountsModel, FinancialModel) per section, in layout order
+    summary_layout_key = None  # (mode, group keys) the current views were laid out for
+
+    def clear_layout(layout: QLayout):
+        while layout.count():
+            item = layout.takeAt(0)
+            if item.widget():
+                item.widget().deleteLater()
+            elif item.layout():
+                clear_layout(item.layout())
+                item.layout().deleteLater()
 
+    def layout_summary_sections(mode, group_keys):
+        """Builds one label + status/financial view pair per group (plus grand totals when sorted)."""
         clear_layout(summary_container)
+        summary_models.clear()
+        sections = [(f"======== ${key:.2f} ========" if mode == "sorted" else "======== All Files ========")
+                    for key in group_keys]
+        if mode == "sorted":
+            sections.append(None)  # Grand totals, no label
+
+        empty = np.zeros((0, 0))
+        for i, label_text in enumerate(sections):
+            row_layout = QHBoxLayout()
+            left_col = QVBoxLayout()
+            if label_text is not None:
+                label = QLabel(label_text)
+                label.setStyleSheet("font-weight: bold; padding: 6px;")
+                left_col.addWidget(label)
+            status_model = StatusCountsModel(empty, [], [])
+            left_col.addWidget(make_summary_table(status_model))
+
+            right_col = QVBoxLayout()
+            if i == 0 and label_text is not None:
+                right_col.addWidget(QLabel("Financial Summary"))
+            financial_model = FinancialModel(empty, [], [])
+            right_col.addWidget(make_summary_table(financial_model))
+
+            row_layout.addLayout(left_col, 2)
+            row_layout.addLayout(right_col, 2)
+            summary_container.addLayout(row_layout)
+            summary_models.append((status_model, financial_model))
+
+        screen.summary_models = summary_models
+
+    def build_payment_summary(mode="sorted"):
+        """Recomputes the summary arrays and pushes them into the existing models.
+
+        The views are only laid out again when the set of groups changes.
+        """
+        nonlocal summary_layout_key
 
         session_dir = state.get("current_session")
         club_name = "Club"
         if session_dir:
-            metadata_path = os.path.join(session_dir, "metadata", "metadata.json")
+            metadata_path = session_metadata_path(session_dir)
             if os.path.exists(metadata_path):
                 try:
-                    with open(metadata_path, "r") as f:
-                        metadata = json.load(f)
-                    club_name = metadata.get("club", "Club")
+                    club_name = read_metadata(metadata_path).get("club", "Club")
                 except:
                     pass
 
         statuses_to_show = STATUS_LIST[:-1]
+        status_columns = [s.capitalize() for s in statuses_to_show]
         status_counts = state.get("status_counts", {})
         fee_schedule = state.get("fee_schedule", {})
         columns = ["Gross", "TrackitHub", "PayPal", club_name]
 
-        grand_status_totals = dict.fromkeys(statuses_to_show, 0)
-        grand_financial_totals = dict.fromkeys(columns, 0.0)
+        grand_status_totals = np.zeros(len(statuses_to_show), dtype=np.int64)
+        grand_financial_totals = np.zeros(len(columns), dtype=np.float64)
 
         if mode == "unsorted":
             all_files = sorted(status_counts.keys())
@@ -1990,137 +2654,46 @@ def create_payment_summary_screen(stack, state) -> QWidget:
                 price = fee_schedule.get(fname, 0.0)
                 grouped.setdefault(price, []).append(fname)
 
-        financial_label_shown = False  # ✅ track if we've added the label
+        group_keys = sorted(grouped) if mode == "sorted" else list(grouped)
+        layout_key = (mode, tuple(group_keys))
+        if layout_key != summary_layout_key:
+            layout_summary_sections(mode, group_keys)
+            summary_layout_key = layout_key
 
-        for group_key in (sorted(grouped) if mode == "sorted" else grouped):
+        for group_key, (status_model, financial_model) in zip(group_keys, summary_models):
             files = sorted(grouped[group_key])
-            price = group_key if mode == "sorted" else None
-            label_text = f"======== ${price:.2f} ========" if mode == "sorted" else "======== All Files ========"
-            label = QLabel(label_text)
-            label.setStyleSheet("font-weight: bold; padding: 6px;")
-
-            row_layout = QHBoxLayout()
-            left_col = QVBoxLayout()
-            left_col.addWidget(label)
-
             show_total = len(files) > 1
+            row_labels = files + (["Total"] if show_total else [])
 
             # Status Table
-            status_table = QTableWidget()
-            status_table.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
-            status_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
-            status_table.setColumnCount(len(statuses_to_show))
-            status_table.setRowCount(len(files) + (1 if show_total else 0))
-            status_table.setHorizontalHeaderLabels([s.capitalize() for s in statuses_to_show])
-            status_table.setVerticalHeaderLabels(files + (["Total"] if show_total else []))
-            status_totals = dict.fromkeys(statuses_to_show, 0)
-
-            for row_idx, fname in enumerate(files):
-                counts = status_counts.get(fname, {})
-                for col_idx, status in enumerate(statuses_to_show):
-                    count = int(counts.get(status, 0))
-                    item = QTableWidgetItem(str(count))
-                    item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                    item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                    status_table.setItem(row_idx, col_idx, item)
-                    status_totals[status] += count
-                    grand_status_totals[status] += count
-
+            status_rows = np.array(
+                [[status_counts.get(fname, {}).get(status, 0) for status in statuses_to_show] for fname in files],
+                dtype=np.int64,
+            ).reshape(len(files), len(statuses_to_show))
+            status_totals = status_rows.sum(axis=0)
+            grand_status_totals += status_totals
+            financial_rows = compute_financials(
+                [fee_schedule.get(fname, 0.0) for fname in files],
+                status_rows[:, statuses_to_show.index("regular")],
+                status_rows[:, statuses_to_show.index("manual")],
+            )
             if show_total:
-                for col_idx, status in enumerate(statuses_to_show):
-                    item = QTableWidgetItem(str(status_totals[status]))
-                    item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                    item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                    status_table.setItem(len(files), col_idx, item)
-
-            status_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
-            left_col.addWidget(status_table)
+                status_rows = np.vstack([status_rows, status_totals])
+            status_model.set_values(status_rows, status_columns, row_labels)
 
             # Financial Table
-            right_col = QVBoxLayout()
-            if not financial_label_shown:
-                right_col.addWidget(QLabel("Financial Summary"))
-                financial_label_shown = True
-
-            financial_table = QTableWidget()
-            financial_table.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
-            financial_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
-            financial_table.setColumnCount(len(columns))
-            financial_table.setRowCount(len(files) + (1 if show_total else 0))
-            financial_table.setHorizontalHeaderLabels(columns)
-            financial_table.setVerticalHeaderLabels(files + (["Total"] if show_total else []))
-            financial_totals = dict.fromkeys(columns, 0.0)
-
-            for row_idx, fname in enumerate(files):
-                price = fee_schedule.get(fname, 0.0)
-                counts = status_counts.get(fname, {})
-                regular = counts.get("regular", 0)
-                manual = counts.get("manual", 0)
-
-                gross = (regular + manual) * price
-                trackithub = gross * 0.10
-                paypal = sum(
-                    price * 0.05 + 0.09 if price <= 10 else price * 0.0349 + 0.49
-                    for _ in range(regular)
-                )
-                net = gross - trackithub - paypal
-                vals = [gross, trackithub, paypal, net]
-
-                for col_idx, val in enumerate(vals):
-                    item = QTableWidgetItem(f"${val:.2f}")
-                    item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                    item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                    financial_table.setItem(row_idx, col_idx, item)
-                    financial_totals[columns[col_idx]] += val
-                    grand_financial_totals[columns[col_idx]] += val
-
+            financial_totals = financial_rows.sum(axis=0)
+            grand_financial_totals += financial_totals
             if show_total:
-                for col_idx, col in enumerate(columns):
-                    item = QTableWidgetItem(f"${financial_totals[col]:.2f}")
-                    item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                    item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                    financial_table.setItem(len(files), col_idx, item)
-
-            financial_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
-            right_col.addWidget(financial_table)
-
-            row_layout.addLayout(left_col, 2)
-            row_layout.addLayout(right_col, 2)
-            summary_container.addLayout(row_layout)
+                financial_rows = np.vstack([financial_rows, financial_totals])
+            financial_model.set_values(financial_rows, columns, row_labels)
 
         # Grand Totals Section
         if mode == "sorted":
-            row_layout = QHBoxLayout()
-            left_col = QVBoxLayout()
-
-            status_table = QTableWidget(1, len(statuses_to_show))
-            status_table.setHorizontalHeaderLabels([s.capitalize() for s in statuses_to_show])
-            for col_idx, status in enumerate(statuses_to_show):
-                val = grand_status_totals[status]
-                item = QTableWidgetItem(str(val))
-                item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                status_table.setItem(0, col_idx, item)
-            status_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
-            left_col.addWidget(status_table)
-
-            right_col = QVBoxLayout()
-            financial_table = QTableWidget(1, len(columns))
-            financial_table.setHorizontalHeaderLabels(columns)
-            for col_idx, col in enumerate(columns):
-                val = grand_financial_totals[col]
-                item = QTableWidgetItem(f"${val:.2f}")
-                item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                financial_table.setItem(0, col_idx, item)
-            financial_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
-            right_col.addWidget(financial_table)
-
-            row_layout.addLayout(left_col, 2)
-            row_layout.addLayout(right_col, 2)
-            summary_container.addLayout(row_layout)
+            status_model, financial_model = summary_models[-1]
+            status_model.set_values(grand_status_totals.reshape(1, -1), status_columns, ["1"])
+            financial_model.set_values(grand_financial_totals.reshape(1, -1), columns, ["1"])
 
-        
     build_payment_summary(mode)
 
     def update_paid_status(status: bool):
@@ -2129,14 +2702,13 @@ def create_payment_summary_screen(stack, state) -> QWidget:
             QMessageBox.warning(screen, "No Session", "No active session loaded.")
             return
 
-        meta_path = os.path.join(session_dir, "metadata", "metadata.json")
+        meta_path = session_metadata_path(session_dir)
         if not os.path.exists(meta_path):
             QMessageBox.warning(screen, "Missing Metadata", "Metadata file not found in current session.")
             return
 
         try:
-            with open(meta_path, "r") as f:
-                metadata = json.load(f)
+            metadata = dict(read_metadata(meta_path))
             metadata["paid"] = status
             write_metadata(meta_path, metadata)
             QMessageBox.information(screen, "Updated", f"Session marked as {'paid' if status else 'unpaid'}.")
@@ -2153,10 +2725,7 @@ def create_payment_summary_screen(stack, state) -> QWidget:
     #unpaid_btn.clicked.connect(lambda: update_paid_status(False))
 
     def refresh_summary():
-        new_screen = create_payment_summary_screen(stack, state)
-        stack.removeWidget(stack.widget(4))
-        stack.insertWidget(4, new_screen)
-        stack.setCurrentIndex(4)
+        build_payment_summary(state.get("payment_summary_mode", "sorted"))
 
     screen.refresh_summary = refresh_summary
 
@@ -2178,10 +2747,21 @@ def create_program_flow_tab(state: Dict, stack:QStackedWidget) -> QStackedWidget
 
     stack.addWidget(create_welcome_screen(stack, state))             # 0
     stack.addWidget(create_session_creation_screen(stack, state))    # 1
-    stack.addWidget(create_assign_status_screen(stack, state))       # 2
+    stack.addWidget(QWidget())  # Placeholder for assign status      # 2
     stack.addWidget(QWidget())  # Placeholder for fee screen          # 3
     stack.addWidget(QWidget())  # Placeholder for payment summary     # 4
 
+    def build_assign_screen_on_first_show(index):
+        # Creating or loading a session swaps in the real screen itself; this covers any other way of reaching it
+        if index != 2 or getattr(stack.widget(2), "is_assign_screen", False):
+            return
+        with blocked(stack):
+            stack.removeWidget(stack.widget(2))
+            stack.insertWidget(2, create_assign_status_screen(stack, state))
+            stack.setCurrentIndex(2)
+
+    stack.currentChanged.connect(build_assign_screen_on_first_show)
+
     return stack
 
 def create_all_sessions_tab(state: dict) -> QWidget:
@@ -2304,25 +2884,22 @@ def create_all_sessions_tab(state: dict) -> QWidget:
     selected_session = None
     selected_file = None
     df = None
+    name_rows = {}
 
     def refresh_all_sessions():
         tree.clear()
-        sessions_path = SESSIONS_DIR
-        if not os.path.exists(sessions_path):
-            return
 
         sessions = []
-        for session_name in os.listdir(sessions_path):
-            session_path = os.path.join(sessions_path, session_name)
-            metadata_path = os.path.join(session_path, "metadata", "metadata.json")
+        for entry in scan_session_dirs():
+            session_name, session_path = entry.name, entry.path
+            metadata_path = session_metadata_path(session_path)
             if not os.path.exists(metadata_path):
                 continue
             try:
-                with open(metadata_path, "r") as f:
-                    metadata = json.load(f)
+                metadata = read_metadata(metadata_path)
                 last_opened_str = metadata.get("last_opened", "1970-01-01T00:00:00")
                 last_opened = datetime.fromisoformat(last_opened_str)
-                sessions.append((session_name, session_path, metadata, last_opened))
+                sessions.append((session_name, session_path, metadata_path, last_opened))
             except:
                 continue
 
@@ -2334,9 +2911,9 @@ def create_all_sessions_tab(state: dict) -> QWidget:
         show_paid = paid_radio.isChecked()
         show_unpaid = unpaid_radio.isChecked()
 
-        for session_name, session_path, metadata, _ in sessions:
+        for session_name, session_path, metadata_path, _ in sessions:
             is_flagged = "-flag" in session_name
-            is_paid = metadata.get("paid", False)
+            is_paid = read_metadata(metadata_path).get("paid", False)
 
             if show_flagged and not is_flagged:
                 continue
@@ -2347,24 +2924,20 @@ def create_all_sessions_tab(state: dict) -> QWidget:
             if show_unpaid and is_paid:
                 continue
 
-            status_str = "paid ✅" if is_paid else "unpaid ❌"
-            net = metadata.get("net_to_club", None)
-            formatted_total = f"${net:.2f}" if isinstance(net, (int, float)) else "No total yet"
+            status_str, formatted_total = session_display_parts(metadata_path)
             display_name = f"{session_name} — {status_str} — total {formatted_total}"
 
             parent_item = QTreeWidgetItem([display_name])
-            csv_path = os.path.join(session_path, "csv")
+            csv_path = session_csv_dir(session_path)
             if not os.path.exists(csv_path):
                 continue
-            for fname in sorted(os.listdir(csv_path)):
-                if fname.endswith(".csv"):
-                    file_item = QTreeWidgetItem(parent_item, [fname])
-                    full_path = os.path.join(csv_path, fname)
-                    file_item.setData(0, Qt.ItemDataRole.UserRole, full_path)
+            for csv_entry in scan_csv_entries(csv_path):
+                file_item = QTreeWidgetItem(parent_item, [csv_entry.name])
+                file_item.setData(0, Qt.ItemDataRole.UserRole, csv_entry.path)
             tree.addTopLevelItem(parent_item)
 
     def on_tree_item_selected(item, _prev=None):
-        nonlocal selected_session, selected_file, df
+        nonlocal selected_session, selected_file, df, name_rows
         if item is None:
             return
         parent = item.parent()
@@ -2379,9 +2952,11 @@ def create_all_sessions_tab(state: dict) -> QWidget:
         if not os.path.exists(full_path):
             return
         try:
-            df = pd.read_csv(full_path)
+            # The editor only shows names and notes; the full file is read when a note is saved
+            df = read_csv_cached(full_path, columns=["Name", "AnkleBreaker notes"])
             if "AnkleBreaker notes" not in df.columns:
                 df["AnkleBreaker notes"] = ""
+            name_rows = df.groupby(df["Name"].astype(str), sort=False).indices if "Name" in df.columns else {}
             if "Name" in df.columns:
                 name_dropdown.blockSignals(True)
                 name_dropdown.clear()
@@ -2393,6 +2968,7 @@ def create_all_sessions_tab(state: dict) -> QWidget:
                 edit_box.setEnabled(True)
         except Exception:
             df = None
+            name_rows = {}
             edit_box.setEnabled(False)
 
     def on_tree_item_double_clicked(item: QTreeWidgetItem, column: int):
@@ -2407,11 +2983,11 @@ def create_all_sessions_tab(state: dict) -> QWidget:
     def on_name_selected(name):
         if df is None:
             return
-        matches = df[df["Name"] == name]
-        if matches.empty:
+        rows = name_rows.get(name)
+        if rows is None or not len(rows):
             abnote_input.clear()
             return
-        abnote = matches["AnkleBreaker notes"].values[0] if "AnkleBreaker notes" in matches.columns else ""
+        abnote = df["AnkleBreaker notes"].iat[rows[0]] if "AnkleBreaker notes" in df.columns else ""
         abnote_input.setText(str(abnote))
 
     def on_save_note():
@@ -2421,16 +2997,36 @@ def create_all_sessions_tab(state: dict) -> QWidget:
         name = name_dropdown.currentText()
         if not name:
             return
-        if "AnkleBreaker notes" not in df.columns:
-            df["AnkleBreaker notes"] = ""
-        df["AnkleBreaker notes"] = df["AnkleBreaker notes"].astype(str)
-        df.loc[df["Name"] == name, "AnkleBreaker notes"] = abnote_input.text()
-        df["default_status"] = df.apply(lambda row: determine_default_status(row["Notes"], row["Name"]), axis=1)
+        rows = name_rows.get(name)
+        if rows is None:
+            return
 
         session_path = os.path.join(SESSIONS_DIR, selected_session)
-        csv_dir = os.path.join(session_path, "csv")
+        csv_dir = session_csv_dir(session_path)
         file_path = os.path.join(csv_dir, selected_file)
-        df.to_csv(file_path, index=False)
+        try:
+            full_df = read_csv_cached(file_path)
+            # Matched by name, not position, in case the file was re-sorted since it was selected
+            matches = full_df["Name"].astype(str) == name if "Name" in full_df.columns else None
+            if matches is None or not matches.any():
+                QMessageBox.warning(scr, "Note Not Saved",
+                    f"'{name}' was not found in {selected_file}.\n\nThe file may have changed since it was selected; reselect it and try again.")
+                return
+
+            for frame in (df, full_df):
+                if "AnkleBreaker notes" not in frame.columns:
+                    frame["AnkleBreaker notes"] = ""
+                frame["AnkleBreaker notes"] = frame["AnkleBreaker notes"].astype(str)
+            df.iloc[rows, df.columns.get_loc("AnkleBreaker notes")] = abnote_input.text()
+            full_df.loc[matches, "AnkleBreaker notes"] = abnote_input.text()
+            # default_status depends only on Notes and Name, which a note edit doesn't touch
+            if "default_status" not in full_df.columns:
+                full_df["default_status"] = determine_default_statuses(full_df)
+            write_session_csv(full_df, file_path)
+        except Exception as e:
+            print(f"[ERROR] Failed to save note to {file_path}: {e}")
+            QMessageBox.warning(scr, "Note Not Saved", f"Could not save the note to {selected_file}:\n{e}")
+            return
 
         state["signals"].sessionsChanged.emit()
         state["signals"].dataChanged.emit()
@@ -2450,7 +3046,6 @@ def create_all_sessions_tab(state: dict) -> QWidget:
     paid_radio.toggled.connect(refresh_all_sessions)
     unpaid_radio.toggled.connect(refresh_all_sessions)
 
-    tree.itemClicked.connect(on_tree_item_selected)
     tree.currentItemChanged.connect(on_tree_item_selected)
     tree.itemDoubleClicked.connect(on_tree_item_double_clicked)
     name_dropdown.currentTextChanged.connect(on_name_selected)
@@ -2477,50 +3072,35 @@ def create_current_session_files_tab(state: Dict) -> QWidget:
     file_dropdown.installEventFilter(state["_wheel_filter"])
     scr_layout.addWidget(file_dropdown)
 
-    table = QTableWidget()
+    table = make_dataframe_table()
+    table_model = table.model()
     scr_layout.addWidget(table)
-    table.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
 
     def load_csv_to_table(path: str):
         try:
-            df = pd.read_csv(path)
+            df = read_csv_cached(path)
         except Exception as e:
-            table.setRowCount(0)
-            table.setColumnCount(1)
-            table.setHorizontalHeaderLabels(["Error"])
-            table.setItem(0, 0, QTableWidgetItem(f"Error loading CSV: {e}"))
+            table_model.show_message("Error", f"Error loading CSV: {e}")
             return
 
-        table.setRowCount(len(df))
-        table.setColumnCount(len(df.columns))
-        table.setHorizontalHeaderLabels(df.columns.tolist())
-
-        for i, row in df.iterrows():
-            for j, val in enumerate(row):
-                item = QTableWidgetItem(str(val))
-                item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                table.setItem(i, j, item)
-
+        table_model.set_frame(df)
         table.resizeColumnsToContents()
         table.horizontalHeader().setStretchLastSection(True)
 
     def load_all_files_to_table():
-        table.clear()
-        table.setRowCount(0)
-        table.setColumnCount(0)
+        table_model.clear()
 
         current_session = state.get("current_session")
-        csv_dir = os.path.join(current_session, "csv")
-        filenames = sorted(f for f in os.listdir(csv_dir) if f.endswith(".csv"))
+        csv_dir = session_csv_dir(current_session)
 
         dfs = []
         color_map = {}
         colors = [QColor("lightblue"), QColor("lightgreen"), QColor("orange"), QColor("violet"), QColor("lightgray")]
 
-        for i, fname in enumerate(filenames):
-            full_path = os.path.join(csv_dir, fname)
+        for i, entry in enumerate(scan_csv_entries(csv_dir)):
+            fname = entry.name
             try:
-                df = pd.read_csv(full_path)
+                df = read_csv_cached(entry.path)
                 df["File"] = fname
                 dfs.append(df)
                 color_map[fname] = colors[i % len(colors)]
@@ -2528,62 +3108,48 @@ def create_current_session_files_tab(state: Dict) -> QWidget:
                 continue
 
         if not dfs:
-            table.setColumnCount(1)
-            table.setRowCount(1)
-            table.setHorizontalHeaderLabels(["Error"])
-            table.setItem(0, 0, QTableWidgetItem("Error loading any CSV files."))
+            table_model.show_message("Error", "Error loading any CSV files.")
             return
 
         combined_df = pd.concat(dfs, ignore_index=True)
-        table.setColumnCount(len(combined_df.columns))
-        table.setHorizontalHeaderLabels(combined_df.columns.tolist())
-        table.setRowCount(len(combined_df))
-
-        for i, row in combined_df.iterrows():
-            row_file = row["File"]
-            row_color = color_map.get(row_file, QColor("white"))
-            for j, val in enumerate(row):
-                item = QTableWidgetItem(str(val))
-                item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                item.setBackground(row_color)
-                table.setItem(i, j, item)
-
+        table_model.set_frame(combined_df, color_map, "File")
         table.resizeColumnsToContents()
         table.horizontalHeader().setStretchLastSection(True)
 
+    def update_display(index):
+        fname = file_dropdown.itemText(index)
+        state["_last_selected_file"] = fname
+        if fname == "View All":
+            load_all_files_to_table()
+        else:
+            full_path = os.path.join(state["current_session"], "csv", fname)
+            load_csv_to_table(full_path)
+
+    file_dropdown.currentIndexChanged.connect(update_display)
+
     def refresh():
         file_dropdown.blockSignals(True)
         file_dropdown.clear()
-        table.setRowCount(0)
-        table.setColumnCount(0)
+        table_model.clear()
 
         current_session = state.get("current_session")
         if not current_session or not os.path.exists(current_session):
             file_dropdown.setEnabled(False)
-            table.setColumnCount(1)
-            table.setRowCount(1)
-            table.setHorizontalHeaderLabels(["Notice"])
-            table.setItem(0, 0, QTableWidgetItem("⚠️ No session created yet."))
+            table_model.show_message("Notice", "⚠️ No session created yet.")
             file_dropdown.blockSignals(False)
             return
 
-        csv_dir = os.path.join(current_session, "csv")
+        csv_dir = session_csv_dir(current_session)
         if not os.path.exists(csv_dir):
             file_dropdown.setEnabled(False)
-            table.setColumnCount(1)
-            table.setRowCount(1)
-            table.setHorizontalHeaderLabels(["Notice"])
-            table.setItem(0, 0, QTableWidgetItem("⚠️ No CSV directory in session."))
+            table_model.show_message("Notice", "⚠️ No CSV directory in session.")
             file_dropdown.blockSignals(False)
             return
 
-        filenames = sorted(f for f in os.listdir(csv_dir) if f.endswith(".csv"))
+        filenames = [e.name for e in scan_csv_entries(csv_dir)]
         if not filenames:
             file_dropdown.setEnabled(False)
-            table.setColumnCount(1)
-            table.setRowCount(1)
-            table.setHorizontalHeaderLabels(["Notice"])
-            table.setItem(0, 0, QTableWidgetItem("⚠️ No CSV files found."))
+            table_model.show_message("Notice", "⚠️ No CSV files found.")
             file_dropdown.blockSignals(False)
             return
 
@@ -2591,17 +3157,6 @@ def create_current_session_files_tab(state: Dict) -> QWidget:
         file_dropdown.addItem("View All")
         file_dropdown.addItems(filenames)
 
-        def update_display(index):
-            fname = file_dropdown.itemText(index)
-            state["_last_selected_file"] = fname
-            if fname == "View All":
-                load_all_files_to_table()
-            else:
-                full_path = os.path.join(csv_dir, fname)
-                load_csv_to_table(full_path)
-
-        file_dropdown.currentIndexChanged.connect(update_display)
-
         # Try to re-select previously selected file or default
         previously_selected = state.get("_last_selected_file")
         options = ["View All"] + filenames
@@ -2615,8 +3170,14 @@ def create_current_session_files_tab(state: Dict) -> QWidget:
 
         file_dropdown.blockSignals(False)
 
-    state["signals"].dataChanged.connect(refresh)
-    state["signals"].sessionsChanged.connect(refresh)
+    # Bursts of status clicks emit dataChanged/sessionsChanged several times per event-loop
+    # pass; a zero-interval single-shot timer folds them into one reload
+    refresh_timer = QTimer(scr)
+    refresh_timer.setSingleShot(True)
+    refresh_timer.setInterval(0)
+    refresh_timer.timeout.connect(refresh)
+    state["signals"].dataChanged.connect(lambda: refresh_timer.start())
+    state["signals"].sessionsChanged.connect(lambda: refresh_timer.start())
 
     scr.refresh = refresh
     scr.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
@@ -2648,59 +3209,46 @@ def create_any_file_viewer_tab(state: Dict) -> QWidget:
     layout.addWidget(QLabel("Select File:"))
     layout.addWidget(file_dropdown)
 
-    table = QTableWidget()
+    table = make_dataframe_table()
+    table_model = table.model()
     layout.addWidget(table)
-    table.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
 
     club_session_file_map = {}
 
     def load_csv_to_table(path: str):
         try:
-            df = pd.read_csv(path)
+            df = read_csv_cached(path)
         except Exception as e:
-            table.setRowCount(0)
-            table.setColumnCount(1)
-            table.setHorizontalHeaderLabels(["Error"])
-            table.setItem(0, 0, QTableWidgetItem(f"Error loading CSV: {e}"))
+            table_model.show_message("Error", f"Error loading CSV: {e}")
             return
 
-        table.setRowCount(len(df))
-        table.setColumnCount(len(df.columns))
-        table.setHorizontalHeaderLabels(df.columns.tolist())
-
-        for i, row in df.iterrows():
-            for j, val in enumerate(row):
-                item = QTableWidgetItem(str(val))
-                item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                table.setItem(i, j, item)
-
+        table_model.set_frame(df)
         table.resizeColumnsToContents()
         table.horizontalHeader().setStretchLastSection(True)
 
+    # csv dir -> (st_mtime_ns, csv names); a folder's mtime changes whenever a file is added, removed or renamed
+    csv_listing_cache = {}
+
     def load_club_session_file_structure():
         structure = defaultdict(lambda: defaultdict(list))
-        for session_name in os.listdir(SESSIONS_DIR):
-            session_path = os.path.join(SESSIONS_DIR, session_name)
-            if not os.path.isdir(session_path):
+        for session in scan_session_dirs():
+            # Extract club name from session folder name
+            parts = session.name.split("-")
+            if len(parts) < 3:
                 continue
+            club = parts[1]
+            csv_dir = session_csv_dir(session.path)
             try:
-                # Extract club name from session folder name
-                parts = session_name.split("-")
-                if len(parts) < 3:
-                    continue
-                club = parts[1]
-                csv_path = os.path.join(session_path, "csv")
-                if not os.path.isdir(csv_path):
-                    continue
-
-                for fname in os.listdir(csv_path):
-                    if fname.endswith(".csv"):
-                        full_path = os.path.join(csv_path, fname)
-                        if os.path.exists(full_path):
-                            structure[club][session_name].append((session_path, fname))
-
-            except Exception as e:
-                continue
+                stamp = os.stat(csv_dir).st_mtime_ns
+            except OSError:
+                csv_listing_cache.pop(csv_dir, None)
+                continue  # No csv folder
+            cached = csv_listing_cache.get(csv_dir)
+            if cached is None or cached[0] != stamp:
+                cached = (stamp, [e.name for e in scan_csv_entries(csv_dir)])
+                csv_listing_cache[csv_dir] = cached
+            if cached[1]:
+                structure[club][session.name].extend((session.path, fname) for fname in cached[1])
         return structure
 
     def refresh_dropdowns():
@@ -2708,65 +3256,50 @@ def create_any_file_viewer_tab(state: Dict) -> QWidget:
 
         club_session_file_map = load_club_session_file_structure()
 
-        club_dropdown.blockSignals(True)
-        session_dropdown.blockSignals(True)
-        file_dropdown.blockSignals(True)
-
-        club_dropdown.clear()
-        session_dropdown.clear()
-        file_dropdown.clear()
-        table.setRowCount(0)
-        table.setColumnCount(0)
-
-        clubs = sorted(club_session_file_map.keys())
-        club_dropdown.addItems(clubs)
-
-        if clubs:
-            club_dropdown.setCurrentIndex(0)
-            on_club_change()
-
-        club_dropdown.blockSignals(False)
-        session_dropdown.blockSignals(False)
-        file_dropdown.blockSignals(False)
-
-    def on_club_change():
-        session_dropdown.blockSignals(True)
-        file_dropdown.blockSignals(True)
-
-        session_dropdown.clear()
-        file_dropdown.clear()
-        table.setRowCount(0)
-        table.setColumnCount(0)
-
-        selected_club = club_dropdown.currentText()
-        print(f"[UI] Selected club: {selected_club}")
-        if selected_club in club_session_file_map:
-            sessions = sorted(club_session_file_map[selected_club].keys())
-            session_dropdown.addItems(sessions)
-            if sessions:
-                session_dropdown.setCurrentIndex(0)
-                on_session_change()
-
-        session_dropdown.blockSignals(False)
-        file_dropdown.blockSignals(False)
-
-    def on_session_change():
-        file_dropdown.blockSignals(True)
-        file_dropdown.clear()
-        table.setRowCount(0)
-        table.setColumnCount(0)
-
-        selected_club = club_dropdown.currentText()
-        selected_session = session_dropdown.currentText()
-        print(f"[UI] Selected session: {selected_session}")
-        if selected_club in club_session_file_map and selected_session in club_session_file_map[selected_club]:
-            file_names = [f for (_, f) in club_session_file_map[selected_club][selected_session]]
-            file_dropdown.addItems(file_names)
-            if file_names:
-                file_dropdown.setCurrentIndex(0)
-                on_file_change()
-
-        file_dropdown.blockSignals(False)
+        with blocked(club_dropdown, session_dropdown, file_dropdown):
+            club_dropdown.clear()
+            session_dropdown.clear()
+            file_dropdown.clear()
+            table_model.clear()
+
+            clubs = sorted(club_session_file_map.keys())
+            club_dropdown.addItems(clubs)
+
+            if clubs:
+                club_dropdown.setCurrentIndex(0)
+                on_club_change()
+
+    # load_first=False only fills the dropdowns, for callers that pick the file themselves
+    def on_club_change(_text=None, load_first=True):
+        with blocked(session_dropdown, file_dropdown):
+            session_dropdown.clear()
+            file_dropdown.clear()
+            table_model.clear()
+
+            selected_club = club_dropdown.currentText()
+            print(f"[UI] Selected club: {selected_club}")
+            if selected_club in club_session_file_map:
+                sessions = sorted(club_session_file_map[selected_club].keys())
+                session_dropdown.addItems(sessions)
+                if sessions:
+                    session_dropdown.setCurrentIndex(0)
+                    on_session_change(load_first=load_first)
+
+    def on_session_change(_text=None, load_first=True):
+        with blocked(file_dropdown):
+            file_dropdown.clear()
+            table_model.clear()
+
+            selected_club = club_dropdown.currentText()
+            selected_session = session_dropdown.currentText()
+            print(f"[UI] Selected session: {selected_session}")
+            if selected_club in club_session_file_map and selected_session in club_session_file_map[selected_club]:
+                file_names = [f for (_, f) in club_session_file_map[selected_club][selected_session]]
+                file_dropdown.addItems(file_names)
+                if file_names:
+                    file_dropdown.setCurrentIndex(0)
+                    if load_first:
+                        on_file_change()
 
     def on_file_change():
         selected_club = club_dropdown.currentText()
@@ -2788,11 +3321,9 @@ def create_any_file_viewer_tab(state: Dict) -> QWidget:
             session_name = session_folder.name
             club = None
 
-            meta_path = os.path.join(session_folder, "metadata", "metadata.json")
+            meta_path = session_metadata_path(session_folder)
             if os.path.exists(meta_path):
-                with open(meta_path) as f:
-                    meta = json.load(f)
-                    club = meta.get("club")
+                club = read_metadata(meta_path).get("club")
 
             if not club or club not in club_session_file_map:
                 print(f"[WARN] Club not found: {club}")
@@ -2806,20 +3337,14 @@ def create_any_file_viewer_tab(state: Dict) -> QWidget:
                 print(f"[WARN] File not found: {file}")
                 return
 
-            club_dropdown.blockSignals(True)
-            session_dropdown.blockSignals(True)
-            file_dropdown.blockSignals(True)
-
-            club_dropdown.setCurrentText(club)
-            on_club_change()
-            session_dropdown.setCurrentText(session_name)
-            on_session_change()
-            file_dropdown.setCurrentText(file)
-            on_file_change()
-
-            club_dropdown.blockSignals(False)
-            session_dropdown.blockSignals(False)
-            file_dropdown.blockSignals(False)
+            # Only the requested file is loaded, not the first file of each level on the way down
+            with blocked(club_dropdown, session_dropdown, file_dropdown):
+                club_dropdown.setCurrentText(club)
+                on_club_change(load_first=False)
+                session_dropdown.setCurrentText(session_name)
+                on_session_change(load_first=False)
+                file_dropdown.setCurrentText(file)
+                on_file_change()
 
         except Exception as e:
             print(f"[ERROR] Failed to load file from path: {e}")
@@ -2855,24 +3380,27 @@ def create_any_file_viewer_tab(state: Dict) -> QWidget:
 # Main window builder
 # ---------------------------------------------------------------------
 def load_session_from_folder(session_dir: str, stack: QStackedWidget, state: Dict, parent_widget: QWidget):
-    metadata_path = os.path.join(session_dir, "metadata", "metadata.json")
-    csv_dir = os.path.join(session_dir, "csv")
+    metadata_path = session_metadata_path(session_dir)
+    csv_dir = session_csv_dir(session_dir)
 
-    
-    if not os.path.exists(metadata_path) or not os.path.isdir(csv_dir):
+    # read_metadata's own os.stat doubles as the metadata.json existence check
+    try:
+        metadata = read_metadata(metadata_path) if os.path.isdir(csv_dir) else None
+    except FileNotFoundError:
+        metadata = None
+    except Exception as e:
+        QMessageBox.critical(parent_widget, "Load Failed", f"Could not load session:\n{e}")
+        return
+    if metadata is None:
         QMessageBox.warning(parent_widget, "Invalid Session", "Selected folder does not appear to be a valid session.")
         return
 
     try:
-        with open(metadata_path, "r") as f:
-            metadata = json.load(f)
-
         # Inline default status logic
         
         # Set session metadata
         state["current_session"] = session_dir
-        for fn in state.get("_refresh_crud_banners", []):
-            fn()
+        schedule_banner_refresh(state)
 
         state["csv_paths"] = []
         state["dataframes"] = {}
@@ -2881,39 +3409,47 @@ def load_session_from_folder(session_dir: str, stack: QStackedWidget, state: Dic
         fee_schedule = metadata.get("fees", {})
         state["fee_schedule"] = {fname: float(val) for fname, val in fee_schedule.items() if isinstance(val, (int, float)) or str(val).replace(".", "", 1).isdigit()}
 
-        filenames = [os.path.basename(p) for p in get_csv_paths_from_dir(csv_dir)]
+        paths = get_csv_paths_from_dir(csv_dir)
 
-        for fname in filenames:
-            path = os.path.join(csv_dir, fname)
-            try:
-                # Force expected structure
-                df = pd.read_csv(path)
-    
-                # Only apply header names if they’re not already correct
-                expected_headers = ["Name", "Email", "Phone Number", "Status", "Registration Time", "Notes"]
-                if list(df.columns[:6]) != expected_headers:
-                    df.columns = expected_headers
-
-                df["default_status"] = df.apply(lambda row: determine_default_status(row["Notes"], row["Name"]), axis=1)
-                if "current_status" not in df.columns:
-                    df["current_status"] = df["default_status"]
+        def prepare(df):
+            # Only apply header names if they’re not already correct
+            if list(df.columns[:6]) != SESSION_CSV_BASE_COLUMNS:
+                df.columns = SESSION_CSV_BASE_COLUMNS
 
+            # One hash of the header instead of a scan of df.columns per check
+            existing = set(df.columns)
+            if "default_status" not in existing:
+                df["default_status"] = determine_default_statuses(df)
+            if "current_status" not in existing:
+                df["current_status"] = df["default_status"].to_numpy()  # Same index; skip alignment
+            if "AnkleBreaker notes" not in existing:
                 df["AnkleBreaker notes"] = ""
+            return categorize_status_columns(df)
 
-                state["csv_paths"].append(path)
-                state["dataframes"][path] = df
-
-                counts = df["current_status"].value_counts().to_dict()
-                state["status_counts"][fname] = counts
-
+        # Parse every file in parallel, then merge into state here on the UI thread
+        def on_loaded(tasks):
+            parent_widget.setEnabled(True)
+            try:
+                for task in tasks:
+                    if task.error is not None:
+                        print(f"[ERROR] Failed to load CSV {task.path}: {task.error}")
+                        continue
+                    df = task.df
+                    state["csv_paths"].append(task.path)
+                    state["dataframes"][task.path] = df
+
+                    state["status_counts"][os.path.basename(task.path)] = count_statuses(df["current_status"])
+
+                # Load and activate Assign Status screen
+                new_assign_screen = create_assign_status_screen(stack, state)
+                stack.removeWidget(stack.widget(2))
+                stack.insertWidget(2, new_assign_screen)
+                stack.setCurrentIndex(2)
             except Exception as e:
-                print(f"[ERROR] Failed to load CSV {path}: {e}")
+                QMessageBox.critical(parent_widget, "Load Failed", f"Could not load session:\n{e}")
 
-        # Load and activate Assign Status screen
-        new_assign_screen = create_assign_status_screen(stack, state)
-        stack.removeWidget(stack.widget(2))
-        stack.insertWidget(2, new_assign_screen)
-        stack.setCurrentIndex(2)
+        parent_widget.setEnabled(False)
+        start_csv_reads(paths, on_loaded, prepare)
 
     except Exception as e:
         QMessageBox.critical(parent_widget, "Load Failed", f"Could not load session:\n{e}")
@@ -2928,9 +3464,11 @@ def reset_session(stack: QStackedWidget, state: Dict, parent: QWidget):
     if reply != QMessageBox.StandardButton.Yes:
         return
 
-    # Save all DataFrames, with fallback if folder was renamed due to unflagging
-    for i, path in enumerate(state.get("csv_paths", [])):
-        dataframes = state.get("dataframes", {})
+    # Save all DataFrames on the thread pool, with fallback if folder was renamed due to unflagging
+    csv_paths = state.get("csv_paths", [])
+    dataframes = state.get("dataframes", {})
+    jobs = []
+    for i, path in enumerate(csv_paths):
         df = None
         if isinstance(dataframes, dict):
             df = dataframes.get(path)
@@ -2941,55 +3479,74 @@ def reset_session(stack: QStackedWidget, state: Dict, parent: QWidget):
                 continue
         if df is None:
             continue
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        jobs.append((df, path))
 
-        folder = os.path.dirname(path)
+    def on_saved(tasks):
+        parent.setEnabled(True)
         try:
-            os.makedirs(folder, exist_ok=True)
-            df.to_csv(path, index=False)
-        except OSError as e:
-            if "non-existent directory" in str(e) and "-flag" in folder:
-                unflagged_folder = folder.replace("-flag", "")
-                new_path = os.path.join(unflagged_folder, os.path.basename(path))
-                os.makedirs(unflagged_folder, exist_ok=True)
-                df.to_csv(new_path, index=False)
-                # Update the path in state to avoid future errors
-                state["csv_paths"][i] = new_path
-            else:
-                raise
-
-    # Clear session-related state
-    keys_to_clear = [
-        "csv_paths", "dataframes", "df", "current_session",
-        "fee_schedule", "status_counts", "_last_selected_file"
-    ]
-    for key in keys_to_clear:
-        state.pop(key, None)
-
-    # ✅ Unlock file upload controls
-    state["session_locked"] = False
-    if state.get("_upload_files_btn"):
-        state["_upload_files_btn"].setEnabled(True)
-    if state.get("_upload_folder_btn"):
-        state["_upload_folder_btn"].setEnabled(True)
-
-    # Rebuild the stack from scratch
-    if stack:
-        stack.removeWidget(stack.widget(0))
-        stack.removeWidget(stack.widget(1))
-        stack.removeWidget(stack.widget(2))
-
-        stack.insertWidget(0, create_welcome_screen(stack, state))
-        stack.insertWidget(1, create_session_creation_screen(stack, state))
-        stack.insertWidget(2, create_assign_status_screen(stack, state))
-        stack.setCurrentIndex(0)
-
-    # Refresh banners if needed
-    for fn in state.get("_refresh_crud_banners", []):
-        fn()
-    state["signals"].sessionsChanged.emit()  # ✅ Add this here
-
-    # Notify the user
-    QMessageBox.information(parent, "Session Reset", "The session has been reset.")
+            for task in tasks:
+                if task.error is None:
+                    continue
+                folder = os.path.dirname(task.path)
+                if isinstance(task.error, OSError) and "non-existent directory" in str(task.error) and "-flag" in folder:
+                    unflagged_folder = folder.replace("-flag", "")
+                    new_path = os.path.join(unflagged_folder, os.path.basename(task.path))
+                    os.makedirs(unflagged_folder, exist_ok=True)
+                    write_session_csv(task.df, new_path)
+                    # Update the path in state to avoid future errors
+                    csv_paths[csv_paths.index(task.path)] = new_path
+                else:
+                    raise task.error
+        except Exception as e:
+            print(f"[ERROR] Failed to save session files: {e}")
+            QMessageBox.critical(parent, "Error", f"Failed to save session files:\n{e}")
+            return
+        finish_reset()
+
+    def finish_reset():
+        # Clear session-related state
+        keys_to_clear = [
+            "csv_paths", "dataframes", "df", "current_session",
+            "fee_schedule", "status_counts", "_last_selected_file"
+        ]
+        for key in keys_to_clear:
+            state.pop(key, None)
+
+        # ✅ Unlock file upload controls
+        state["session_locked"] = False
+        if state.get("_upload_files_btn"):
+            state["_upload_files_btn"].setEnabled(True)
+        if state.get("_upload_folder_btn"):
+            state["_upload_folder_btn"].setEnabled(True)
+
+        # Rebuild the stack from scratch
+        if stack:
+            # Swap the pages silently, then announce the final page once
+            with blocked(stack):
+                # High to low, so removing one page doesn't shift the next index.
+                # Their state["signals"] hookups are dropped when they are destroyed.
+                for i in (2, 1, 0):
+                    old_page = stack.widget(i)
+                    stack.removeWidget(old_page)
+                    old_page.deleteLater()
+
+                stack.insertWidget(0, create_welcome_screen(stack, state))
+                stack.insertWidget(1, create_session_creation_screen(stack, state))
+                stack.insertWidget(2, QWidget())  # Assign status is built on first show
+                stack.setCurrentIndex(0)
+            stack.currentChanged.emit(0)
+
+        # Refresh banners if needed
+        schedule_banner_refresh(state)
+        state["signals"].sessionsChanged.emit()  # ✅ Add this here
+
+        # Notify the user
+        QMessageBox.information(parent, "Session Reset", "The session has been reset.")
+
+    # Nothing can edit the frames while they are being written
+    parent.setEnabled(False)
+    start_csv_writes(jobs, on_saved)
 
 def create_main_window() -> QWidget:
     container = QWidget()
@@ -3099,8 +3656,7 @@ def create_main_window() -> QWidget:
 
             # Create default metadata.json if missing
             if not metadata_path.exists():
-                with open(metadata_path, "w") as f:
-                    json.dump({"clubs": DEFAULT_CLUBS}, f, indent=4)
+                write_json_atomic(metadata_path, {"clubs": DEFAULT_CLUBS})
 
             # Update config and notify
             settings.setValue("base_path", str(new_base))
@@ -3139,10 +3695,8 @@ def create_main_window() -> QWidget:
                     state["fee_schedule"] = {}
                 if state.get("_welcome_next_btn"):
                     state["_welcome_next_btn"].setEnabled(False)
-                if callable(state.get("refresh_current_session_label")):
-                    state["refresh_current_session_label"]()
-                for fn in state.get("_refresh_crud_banners", []):
-                    fn()
+                # The session label is one of the banners
+                schedule_banner_refresh(state)
                 state["signals"].sessionsChanged.emit()
                 state["signals"].dataChanged.emit()
                 QMessageBox.information(container, "Deleted", f"Deleted session:\n{session_name}")
@@ -3187,12 +3741,7 @@ def create_main_window() -> QWidget:
     tabs.currentChanged.connect(refresh_dynamic_tab)
 
     def track_graphical_loader_change(index):
-        current_widget = state["stack"].widget(index)
-        for i in range(state["stack"].count()):
-            widget = state["stack"].widget(i)
-            if hasattr(widget, "is_graphical_loader") and widget.is_graphical_loader:
-                past_sessions_btn.setEnabled(current_widget != widget)
-                break
+        past_sessions_btn.setEnabled(state["stack"].widget(index) is not state.get("_graphical_loader_widget"))
 
     state["stack"].currentChanged.connect(track_graphical_loader_change)
 
@@ -3216,26 +3765,14 @@ def main() -> None:
 
     qss_path = os.path.join(base_path, "style.qss")
     try:
-        with open(qss_path, "r") as f:
+        with open(qss_path, encoding="utf-8") as f:
             app.setStyleSheet(f.read())
     except Exception as e:
         print(f"Warning: Failed to load stylesheet ({qss_path}): {e}")
 
+    # create_main_window hooks its tabs up to refresh the page they switch to
     main_widget = create_main_window()
 
-    # Hook up dynamic refresh
-    def refresh_dynamic_tab(index):
-        tab_widget = main_widget.findChild(QTabWidget)
-        if not tab_widget:
-            return
-        widget = tab_widget.widget(index)
-        if hasattr(widget, "refresh"):
-            widget.refresh()
-
-    tab_widget = main_widget.findChild(QTabWidget)
-    if tab_widget:
-        tab_widget.currentChanged.connect(refresh_dynamic_tab)
-
     main_widget.setWindowTitle("AnkleBreaker")
     main_widget.resize(1900, 1000)
     main_widget.show()